@@ -4,12 +4,21 @@
 import os
 import sys
 import json
+import copy
+import hashlib
+import hmac
 import threading
 import subprocess
 import queue
 import csv
+import io
+import codecs
+import locale
 import shutil
+import collections
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from urllib.parse import urlparse
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 import math
@@ -26,6 +35,28 @@ try:
 except Exception:
     requests = None
 
+# Streaming XLSX reader for validation (falls back to pd.read_excel)
+try:
+    import openpyxl
+except Exception:
+    openpyxl = None
+
+# Arrow-backed string columns for the validator (plain object columns without it)
+try:
+    import pyarrow
+    import pyarrow.compute as pc
+    from pyarrow import csv as pacsv
+    _STR_DTYPE = "string[pyarrow]"
+except Exception:
+    pyarrow = pc = pacsv = None
+    _STR_DTYPE = str
+
+# Faster JSON for config.json (falls back to stdlib json)
+try:
+    import orjson
+except Exception:
+    orjson = None
+
 # Voice (Windows SAPI via pyttsx3). If not available, app still runs silently.
 try:
     import pyttsx3
@@ -34,6 +65,22 @@ except Exception:
     pyttsx3 = None
     _HAS_TTS = False
 
+_TTS_ENGINE = None
+_TTS_LOCK = threading.Lock()
+
+def _get_tts():
+    """Initialise the SAPI engine once; caller must hold _TTS_LOCK."""
+    global _TTS_ENGINE
+    if _TTS_ENGINE is None:
+        _TTS_ENGINE = pyttsx3.init()
+    return _TTS_ENGINE
+
+# Vectorised gradient fill (optional; PIL-only path otherwise)
+try:
+    import numpy as np
+except Exception:
+    np = None
+
 # Better image scaling (optional)
 try:
     from PIL import Image, ImageTk, ImageEnhance
@@ -124,6 +171,29 @@ def set_ttk_theme(root: tk.Tk):
     style.map("TEntry",
               fieldbackground=[("!disabled", "#ffffff")])
 
+# ============ Precompiled patterns ============
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+_WS_RE = re.compile(r"\s+")
+_PUNCT_ONLY_RE = re.compile(r"[-–—•\s]+")
+_SLUG_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+_SLUG_DASHES_RE = re.compile(r"-+")
+_HANDLE_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+_URL_RE = re.compile(r"^https?://", re.I)
+_IMG_EXT_RE = re.compile(r"\.(jpg|jpeg|png|gif|webp|tiff?)($|\?)", re.I)
+_PRICE_RE = re.compile(r"^\d+(\.\d+)?$")
+# columns _worker_preflight normalises once up front
+_PREFLIGHT_COLS = ("Title*", "Vendor*", "Body (HTML)", "SEO Title", "SEO Description",
+                   "Option1 Name", "Option1 Values", "Variant Price*", "Handle (optional)")
+_PLACEHOLDER_TOKENS = ("lorem ipsum", "placeholder", "coming soon", "tbd", "to be decided", "to be defined")
+_PLACEHOLDER_RE = re.compile("|".join(re.escape(tok) for tok in _PLACEHOLDER_TOKENS))
+_WIN_BAD_TABLE = str.maketrans({c: "-" for c in '<>:"/\\|?*'})
+
+def _strip(s) -> str:
+    return str(s or "").strip()
+
+def _strip_lower(s) -> str:
+    return str(s or "").strip().lower()
+
 def _looks_like_placeholder_body(s: str) -> bool:
     """
     Returns True if Body (HTML) looks like a placeholder:
@@ -131,23 +201,30 @@ def _looks_like_placeholder_body(s: str) -> bool:
     - only punctuation/dashes/bullets
     - real text length (after stripping HTML/entities) < 20 chars
     """
-    t = str(s or "").strip().lower()
+    return _looks_like_placeholder_norm(_strip_lower(s))
+
+def _looks_like_placeholder_norm(t: str) -> bool:
+    """_looks_like_placeholder_body for input that is already stripped + lowercased."""
+    has_tag, has_entity = "<" in t, "&" in t
+    if len(t) < 20 and not has_tag and not has_entity:
+        return bool(t)  # cleanup can only shrink it: non-blank and already too short
     # strip HTML tags
-    t = re.sub(r"<[^>]*>", "", t)
+    if has_tag:
+        t = _HTML_TAG_RE.sub("", t)
     # normalize common entities and whitespace
-    t = t.replace("&nbsp;", " ").replace("&#160;", " ")
-    t = re.sub(r"\s+", " ", t).strip()
+    if has_entity:
+        t = t.replace("&nbsp;", " ").replace("&#160;", " ")
+    t = _WS_RE.sub(" ", t).strip()
     if not t:
         return False  # blank is handled by Error 107
     # too short after cleanup
     if len(t) < 20:
         return True
     # common placeholders
-    bad_tokens = ("lorem ipsum", "placeholder", "coming soon", "tbd", "to be decided", "to be defined")
-    if any(tok in t for tok in bad_tokens):
+    if any(tok in t for tok in _PLACEHOLDER_TOKENS):
         return True
     # just punctuation/dashes/bullets
-    if re.fullmatch(r"[-–—•\s]+", t):
+    if _PUNCT_ONLY_RE.fullmatch(t):
         return True
     return False
 
@@ -172,11 +249,86 @@ def config_path() -> Path:
 def guidelines_storage_path() -> Path:
     return appdata_dir() / GUIDELINES_BASENAME
 
+def _fast_copy(src, dst):
+    """Copy a file with an in-kernel fast path where there is one, else 1 MiB chunks."""
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as s, open(dst, "wb") as d:
+                left = os.fstat(s.fileno()).st_size
+                while left > 0:
+                    n = os.copy_file_range(s.fileno(), d.fileno(), left)
+                    if n <= 0:
+                        break
+                    left -= n
+            if left <= 0:
+                return
+        except OSError:
+            pass
+    try:
+        shutil.copyfile(src, dst)
+    except OSError:
+        with open(src, "rb", buffering=0) as s, open(dst, "wb", buffering=0) as d:
+            shutil.copyfileobj(s, d, length=1 << 20)
+
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+# parsed config.json, keyed by the file's mtime so repeated reads skip disk + parse
+_CFG_CACHE = {"mtime": None, "data": None}
+
+def _index_users(cfg: dict) -> dict:
+    """Attach an in-memory username -> user record map (never written to disk)."""
+    cfg["users_by_name"] = {rec.get("username"): rec for rec in cfg.get("users", [])}
+    return cfg
+
+def hash_password(pw: str) -> dict:
+    """scrypt hash + random salt, stored in the user record instead of the plaintext password."""
+    salt = os.urandom(16)
+    h = hashlib.scrypt(pw.encode("utf-8"), salt=salt, n=2**14, r=8, p=1, dklen=32)
+    return {"salt": salt.hex(), "hash": h.hex(), "v": 1}
+
+def verify_password(rec: dict, pw: str) -> bool:
+    """Constant-time check against a hashed record (or a legacy plaintext 'password')."""
+    if not rec:
+        return False
+    if "hash" in rec:
+        try:
+            salt = bytes.fromhex(rec.get("salt", ""))
+            expected = bytes.fromhex(rec["hash"])
+        except ValueError:
+            return False
+        h = hashlib.scrypt(pw.encode("utf-8"), salt=salt, n=2**14, r=8, p=1, dklen=len(expected) or 32)
+        return hmac.compare_digest(h, expected)
+    stored = rec.get("password")
+    if stored is None:
+        return False
+    return hmac.compare_digest(str(stored).encode("utf-8"), pw.encode("utf-8"))
+
+def set_password(rec: dict, pw: str):
+    rec.pop("password", None)
+    rec.update(hash_password(pw))
+
 def load_config() -> dict:
     p = config_path()
-    if p.exists():
+    try:
+        mtime = p.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is not None:
+        if _CFG_CACHE["mtime"] == mtime and _CFG_CACHE["data"] is not None:
+            return copy.deepcopy(_CFG_CACHE["data"])
         try:
-            return json.loads(p.read_text(encoding="utf-8"))
+            data = _index_users(_json_loads(p.read_bytes()))
+            _CFG_CACHE["mtime"] = mtime
+            _CFG_CACHE["data"] = data
+            return copy.deepcopy(data)
         except Exception:
             pass
     cfg = {
@@ -186,30 +338,30 @@ def load_config() -> dict:
         "remember_last_user": False,
         "last_user": ""
     }
-    try:
-        p.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
-    except Exception:
-        pass
-    return cfg
+    save_config(cfg)
+    return _index_users(cfg)
 
 def save_config(cfg: dict):
+    p = config_path()
     try:
-        config_path().write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+        on_disk = {k: v for k, v in cfg.items() if k != "users_by_name"}
+        p.write_bytes(_json_dumps(on_disk))
+        _CFG_CACHE["mtime"] = p.stat().st_mtime_ns
+        _CFG_CACHE["data"] = _index_users(copy.deepcopy(on_disk))
     except Exception:
-        pass
+        _CFG_CACHE["mtime"] = _CFG_CACHE["data"] = None
 
 def blend_hex(c1: str, c2: str, t: float) -> str:
-    c1 = c1.lstrip("#"); c2 = c2.lstrip("#")
-    r1,g1,b1 = int(c1[0:2],16), int(c1[2:4],16), int(c1[4:6],16)
-    r2,g2,b2 = int(c2[0:2],16), int(c2[2:4],16), int(c2[4:6],16)
+    v1 = int(c1.lstrip("#"), 16); v2 = int(c2.lstrip("#"), 16)
+    r1,g1,b1 = (v1 >> 16) & 0xff, (v1 >> 8) & 0xff, v1 & 0xff
+    r2,g2,b2 = (v2 >> 16) & 0xff, (v2 >> 8) & 0xff, v2 & 0xff
     r = int(r1 + (r2-r1)*t); g = int(g1 + (g2-g1)*t); b = int(b1 + (b2-b1)*t)
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return f"#{(r << 16) | (g << 8) | b:06x}"
 
 def slugify_like(s: str) -> str:
-    import re
-    s = str(s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("-")
+    s = _strip_lower(s)
+    s = _SLUG_NONALNUM_RE.sub("-", s)
+    s = _SLUG_DASHES_RE.sub("-", s).strip("-")
     return s[:255]
 
 def is_valid_handle(s: str) -> bool:
@@ -218,33 +370,76 @@ def is_valid_handle(s: str) -> bool:
     no leading/trailing hyphen, no spaces, no uppercase, no symbols.
     Empty string is allowed (it's optional and can be auto-generated later).
     """
-    s = str(s or "").strip()
+    return _is_valid_handle_norm(_strip(s))
+
+def _is_valid_handle_norm(s: str) -> bool:
+    """is_valid_handle for input that is already stripped."""
     if not s:
         return True  # optional field
-    import re
     if len(s) > 255:
         return False
     # allow segments of [a-z0-9] separated by single hyphens
-    return bool(re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", s))
+    return bool(_HANDLE_RE.match(s))
 
 def is_url(s: str) -> bool:
-    import re
-    return bool(re.match(r"^https?://", str(s or "").strip(), re.I))
+    return bool(_URL_RE.match(_strip(s)))
 
 def looks_like_image_url(s: str) -> bool:
-    import re
-    return bool(re.search(r"\.(jpg|jpeg|png|gif|webp|tiff?)($|\?)", str(s or "").lower()))
+    return bool(_IMG_EXT_RE.search(str(s or "").lower()))
+
+_HTTP = None
+
+def _http_session():
+    """Shared keep-alive session so image checks reuse TCP/TLS connections."""
+    global _HTTP
+    if _HTTP is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        sess = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                              max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+        sess.mount("https://", adapter)
+        sess.mount("http://", adapter)
+        sess.headers["User-Agent"] = f"{APP_TITLE} image-check"
+        _HTTP = sess
+    return _HTTP
+
+# per-run memo of image checks; variants of one product usually share image URLs
+_IMG_CHECK_CACHE = {}  # stripped url -> (ok, note), oldest first
+_IMG_CHECK_MAX = 20000
+_IMG_CHECK_LOCK = threading.Lock()
+
+def clear_image_check_cache():
+    with _IMG_CHECK_LOCK:
+        _IMG_CHECK_CACHE.clear()
 
 def check_image_url(url: str, timeout=8):
+    # memoised on the stripped URL so padded copies of a link share one probe
+    key = (url or "").strip()
+    cached = _IMG_CHECK_CACHE.get(key)
+    if cached is not None:
+        return cached
+    result = _probe_image_url(key, timeout)
+    with _IMG_CHECK_LOCK:
+        if len(_IMG_CHECK_CACHE) >= _IMG_CHECK_MAX:
+            _IMG_CHECK_CACHE.pop(next(iter(_IMG_CHECK_CACHE)), None)
+        _IMG_CHECK_CACHE[key] = result
+    return result
+
+def _probe_image_url(url: str, timeout=8):
     if not url or not is_url(url):
         return False, "Not a URL"
     if requests is None:
         return (looks_like_image_url(url), "requests not installed; extension check")
     try:
-        resp = requests.head(url, allow_redirects=True, timeout=timeout)
+        http = _http_session()
+        resp = http.head(url, allow_redirects=True, timeout=(3, timeout))
         if resp.status_code == 405:
-            resp = requests.get(url, stream=True, timeout=timeout)
-        if resp.status_code != 200:
+            # HEAD not allowed: ask for a single byte so the CDN doesn't stream the whole image
+            resp = http.get(url, headers={"Range": "bytes=0-0"}, stream=True,
+                            allow_redirects=True, timeout=(3, timeout))
+            resp.close()
+        if resp.status_code not in (200, 206):
             return False, f"HTTP {resp.status_code}"
         ctype = (resp.headers.get("Content-Type") or "").lower()
         if "image" not in ctype:
@@ -253,22 +448,73 @@ def check_image_url(url: str, timeout=8):
     except Exception as e:
         return False, f"Error: {e}"
 
+def check_image_urls(urls, max_workers=16, timeout=8, per_host=8):
+    """
+    Check many image URLs concurrently. Duplicates (after stripping) are checked once.
+    Returns {url: (ok, note)}. At most `per_host` requests hit one host at a time.
+    """
+    keys = {u: u.strip() for u in urls if u}
+    unique = list(dict.fromkeys(keys.values()))
+    if not unique:
+        return {}
+    host_sems = {}
+    sems_lock = threading.Lock()
+
+    def _one(u):
+        try:
+            host = urlparse(u).netloc.lower()
+        except ValueError:
+            host = ""
+        with sems_lock:
+            sem = host_sems.setdefault(host, threading.BoundedSemaphore(per_host))
+        with sem:
+            return u, check_image_url(u, timeout)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as ex:
+        by_key = dict(ex.map(_one, unique))
+    return {u: by_key[k] for u, k in keys.items()}
+
 def is_valid_positive_price_token(x: str) -> bool:
     """
     Accepts strings like 10, 10.0, 19.99 (no commas/currency).
     Must be strictly > 0.
     """
-    s = str(x or "").strip()
+    return _is_valid_price_norm(_strip(x))
+
+def _is_valid_price_norm(s: str) -> bool:
+    """is_valid_positive_price_token for input that is already stripped."""
     if not s:
         return False
-    import re
-    if not re.match(r"^\d+(\.\d+)?$", s):  # reject commas, currency, letters, etc.
+    if not _PRICE_RE.match(s):  # reject commas, currency, letters, etc.
         return False
     try:
         return float(s) > 0.0
     except Exception:
         return False
 
+_GRAD_CACHE = collections.OrderedDict()  # (w, h, top_rgb, bottom_rgb) -> PhotoImage
+_GRAD_CACHE_MAX = 4
+
+def _gradient_photo(w, h, top, bottom):
+    """PhotoImage of a top->bottom gradient; top/bottom are 8-bit RGB tuples. Small LRU."""
+    key = (w, h, top, bottom)
+    img = _GRAD_CACHE.get(key)
+    if img is not None:
+        _GRAD_CACHE.move_to_end(key)
+        return img
+    if np is not None:
+        grad = np.linspace(top, bottom, h, endpoint=False).astype(np.uint8)
+        arr = np.ascontiguousarray(np.broadcast_to(grad[:, None, :], (h, w, 3)))
+        pil = Image.fromarray(arr, "RGB")
+    else:
+        strip = Image.new("RGB", (1, h))
+        strip.putdata([tuple(int(a + (b - a) * i / h) for a, b in zip(top, bottom)) for i in range(h)])
+        pil = strip.resize((w, h), Image.NEAREST)
+    img = _GRAD_CACHE[key] = ImageTk.PhotoImage(pil)
+    if len(_GRAD_CACHE) > _GRAD_CACHE_MAX:
+        _GRAD_CACHE.popitem(last=False)
+    return img
+
 def draw_vertical_gradient(canvas: tk.Canvas, color_top="#000000", color_bottom="#000000"):
     canvas.delete("grad")
     w = canvas.winfo_width()
@@ -277,9 +523,18 @@ def draw_vertical_gradient(canvas: tk.Canvas, color_top="#000000", color_bottom=
         return
     r1, g1, b1 = canvas.winfo_rgb(color_top)
     r2, g2, b2 = canvas.winfo_rgb(color_bottom)
+
+    if _HAS_PIL:
+        # one image item instead of h line items
+        top, bottom = (r1 >> 8, g1 >> 8, b1 >> 8), (r2 >> 8, g2 >> 8, b2 >> 8)
+        canvas._grad_img = _gradient_photo(w, h, top, bottom)  # keep a ref past LRU eviction
+        canvas.create_image(0, 0, anchor="nw", image=canvas._grad_img, tags=("grad",))
+        return
+
     r_ratio = (r2 - r1) / max(h, 1)
     g_ratio = (g2 - g1) / max(h, 1)
     b_ratio = (b2 - b1) / max(h, 1)
+
     for i in range(h):
         nr = int(r1 + (r_ratio * i))
         ng = int(g1 + (g_ratio * i))
@@ -297,36 +552,339 @@ def _sku_regex():
     return STRICT_SKU_RE
 
 def extract_base_6(s: str):
-    m = _sku_regex().match(str(s or "").strip())
+    m = _sku_regex().match(_strip(s))
     if not m:
         return None
     return int(m.group("base"))
 
+def _read_prev_sku_column(prev_path: Path):
+    """Read just 'Variant SKU' from a previous export; None if the column isn't there."""
+    if prev_path.suffix.lower() in {".xlsx", ".xls"}:
+        head = pd.read_excel(prev_path, dtype=str, nrows=0)
+        if "Variant SKU" not in head.columns:
+            return None
+        return pd.read_excel(prev_path, dtype=str, usecols=[list(head.columns).index("Variant SKU")])
+    head = pd.read_csv(prev_path, dtype=str, nrows=0)
+    if "Variant SKU" not in head.columns:
+        return None
+    return _read_csv_str(prev_path, usecols=["Variant SKU"])
+
+def _write_csv_bom(df, path):
+    """UTF-8-with-BOM CSV (what Excel/Shopify expect).
+
+    Stays on pandas' writer: Arrow's quotes every string cell and the header and
+    uses bare LF line ends, which changes the file users already import."""
+    df.to_csv(path, index=False, encoding="utf-8-sig")
+
+def _norm_isin(series, values):
+    """Bool array: series.strip().lower() in values, in one Arrow kernel chain when possible."""
+    if pc is not None:
+        try:
+            # straight from the object buffer; a non-str cell raises and takes the pandas path
+            arr = pyarrow.array(series.to_numpy(dtype=object), type=pyarrow.string(), from_pandas=True)
+            hit = pc.is_in(pc.utf8_lower(pc.utf8_trim_whitespace(arr)),
+                           value_set=pyarrow.array(list(values), type=pyarrow.string()))
+            return hit.to_numpy(zero_copy_only=False)
+        except Exception:
+            pass
+    return series.astype(str).str.strip().str.lower().isin(values).to_numpy()
+
+def _read_csv_str(path, usecols=None):
+    """
+    pd.read_csv(dtype=str) on the C parser. engine="pyarrow" infers numeric
+    types first and casts afterwards, so an all-digit SKU column with a blank
+    cell comes back as '110357.0' / 'nan' and blank titles as 'None'.
+    """
+    return pd.read_csv(path, dtype=str, usecols=usecols)
+
+_PREV_EXPORT_COLS = ("Title", "Variant SKU")
+
+# read_excel's default NA tokens ('N/A', '#N/A', 'NA', 'null', '' ...)
+try:
+    from pandas._libs.parsers import STR_NA_VALUES as _XL_NA_VALUES
+except Exception:
+    _XL_NA_VALUES = frozenset()
+
+def _xl_cell_str(v):
+    """Cell value as read_excel(dtype=str) would give it; None for empty/NA cells."""
+    if v is None:
+        return None
+    if isinstance(v, str):
+        return None if v in _XL_NA_VALUES else v
+    if isinstance(v, float) and v.is_integer():
+        v = int(v)
+    return str(v)
+
+def _read_products_sheet(path, sheet=None, usecols=None):
+    """
+    Read a sheet as all-string columns (None for empty cells) using openpyxl's
+    read-only row stream. sheet=None means the first sheet; usecols keeps only
+    the named columns that exist (row count is unaffected). .xls, or a missing
+    openpyxl, goes through pd.read_excel.
+    """
+    path = Path(path)
+    if openpyxl is None or path.suffix.lower() == ".xls":
+        df = pd.read_excel(path, sheet_name=sheet if sheet is not None else 0, dtype=str)
+        return df if usecols is None else df[[c for c in df.columns if c in usecols]]
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet is not None else wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        headers, seen = [], {}
+        for i, h in enumerate(header):
+            h = f"Unnamed: {i}" if h is None else str(h)
+            if h in seen:  # mangle duplicates like pandas does (X, X.1, ...)
+                seen[h] += 1
+                h = f"{h}.{seen[h]}"
+            else:
+                seen[h] = 0
+            headers.append(h)
+        keep = [(j, h) for j, h in enumerate(headers) if usecols is None or h in usecols]
+        cols = [[] for _ in keep]
+        nrows = 0
+        for row in rows:
+            if not any(v is not None for v in row):
+                continue  # read_excel skips blank rows
+            nrows += 1
+            for k, (j, _) in enumerate(keep):
+                cols[k].append(_xl_cell_str(row[j]) if j < len(row) else None)
+    finally:
+        wb.close()
+    names = [h for _, h in keep]
+    return pd.DataFrame(dict(zip(names, cols)), columns=names, index=pd.RangeIndex(nrows), dtype=object)
+
 def load_prev_highest_base(prev_path: Path) -> int:
     """Used only to validate presence of a highest SKU (Error 103)."""
     if pd is None or not prev_path or not prev_path.exists():
         return 0
     try:
-        if prev_path.suffix.lower() in {".xlsx", ".xls"}:
-            pdf = pd.read_excel(prev_path, dtype=str)
-        else:
-            pdf = pd.read_csv(prev_path, dtype=str)
+        pdf = _read_prev_sku_column(prev_path)
     except Exception:
         return 0
     if pdf is None or pdf.empty:
         return 0
-    pdf = pdf.fillna("")
-    if "Variant SKU" not in pdf.columns:
-        return 0
-    col = pdf["Variant SKU"].astype(str).str.strip().tolist()
-    top_cell = next((v for v in col if v and v.lower() != "nan"), None)
-    if top_cell:
-        b = extract_base_6(top_cell)
+    return _highest_base_from_skus(pdf["Variant SKU"])
+
+def _highest_base_from_skus(skus) -> int:
+    """Highest 6-digit base in a 'Variant SKU' column (top filled cell wins if it parses)."""
+    col = skus.fillna("").astype(str).str.strip()
+    filled = col[col.ne("") & col.str.lower().ne("nan")]
+    if not filled.empty:
+        b = extract_base_6(filled.iat[0])
         if b is not None:
             return b
-    bases = [extract_base_6(v) for v in col if v]
-    bases = [b for b in bases if b is not None]
-    return max(bases) if bases else 0
+    bases = filled.str.extract(r"^(\d{6})(?:-\d{2})?$", expand=False).dropna()
+    return int(bases.astype(int).max()) if not bases.empty else 0
+
+# ===== Preflight checks =====
+# Each check is a pure function of the (already normalised) sheet so
+# _worker_preflight can run them side by side. They all return
+# (codes, section_or_None, broken_titles).
+
+def _top_rows(mask, k):
+    """Positions of the first k flagged rows plus the total count (no full row list)."""
+    arr = np.flatnonzero(mask.to_numpy(dtype=bool, na_value=False))
+    return arr[:k], arr.size
+
+def _more(n, cap):
+    return f"\n  ... and {n - cap} more row(s)" if n > cap else ""
+
+def _check_105(df, ctx):
+    """Error 105: missing mandatory columns/values."""
+    norm = ctx["norm"]
+    miss_msgs = []
+    if "Title*" not in df.columns or "Vendor*" not in df.columns or "Variant Price*" not in df.columns:
+        missing_cols = [c for c in ["Title*","Vendor*","Variant Price*"] if c not in df.columns]
+        miss_msgs.append(f"- Missing required column(s): {', '.join(missing_cols)}")
+    else:
+        miss_t = df.index[norm["Title*"].eq("")].tolist()
+        miss_v = df.index[norm["Vendor*"].eq("")].tolist()
+        miss_p = df.index[norm["Variant Price*"].eq("")].tolist()
+        if miss_t: miss_msgs.append(f"- Missing Title* on rows: {', '.join(str(i+2) for i in miss_t)}")
+        if miss_v: miss_msgs.append(f"- Missing Vendor* on rows: {', '.join(str(i+2) for i in miss_v)}")
+        if miss_p: miss_msgs.append(f"- Missing Variant Price* on rows: {', '.join(str(i+2) for i in miss_p)}")
+    if not miss_msgs:
+        return (), None, ()
+    return ("105",), "Error 105: Mandatory fields missing\n" + "\n".join(miss_msgs), ()
+
+def _check_110(df, ctx):
+    """Error 110: Option1 Name/Values must be paired."""
+    norm, blank = ctx["norm"], ctx["blank"]
+    if "Option1 Name" not in df.columns and "Option1 Values" not in df.columns:
+        return (), None, ()
+    name_series = norm.get("Option1 Name", blank)
+    vals_series = norm.get("Option1 Values", blank)
+    # flag if exactly one is present
+    top, n = _top_rows(name_series.ne("") ^ vals_series.ne(""), 60)  # cap lines for dialog length
+    if not n:
+        return (), None, ()
+    titles, name_np, vals_np = ctx["titles_np"], name_series.to_numpy(dtype=object), vals_series.to_numpy(dtype=object)
+    lines = []
+    for i in top:
+        lines.append(f"- Row {i + 2}: Title='{titles[i]}'  Option1 Name='{name_np[i]}'  Option1 Values='{vals_np[i]}'")
+    return ("110",), "Error 110: Variant Options Mismatch (Option1)\n" + "\n".join(lines) + _more(n, 60), ()
+
+def _check_108(df, ctx):
+    """Error 108: non-numeric, zero or negative prices."""
+    if "Variant Price*" not in df.columns:
+        return (), None, ()
+    col = ctx["norm"]["Variant Price*"]
+    # Skip blanks here (already handled by Error 105 missing mandatory)
+    nonblank = col.ne("")
+    fmt_ok = col.str.match(_PRICE_RE.pattern, na=False)
+    positive = pd.to_numeric(col.where(fmt_ok), errors="coerce").gt(0).fillna(False).astype(bool)
+    top, n = _top_rows(nonblank & ~(fmt_ok & positive), 60)  # show first 60 rows to keep dialog small
+    if not n:
+        return (), None, ()
+    titles, price_np = ctx["titles_np"], col.to_numpy(dtype=object)
+    lines = []
+    for i in top:
+        lines.append(f"- Row {i + 2}: {titles[i]} — price='{price_np[i]}'")
+    return ("108",), "Error 108: Invalid Price\n" + "\n".join(lines) + _more(n, 60), ()
+
+def _check_106(df, ctx):
+    """Error 106: missing SEO Title/Description on any row."""
+    norm = ctx["norm"]
+    present_seo_cols = [c for c in ["SEO Title", "SEO Description"] if c in df.columns]
+    if not present_seo_cols:
+        return (), None, ()
+    cond = norm[present_seo_cols[0]].eq("")
+    for c in present_seo_cols[1:]:
+        cond = cond | norm[c].eq("")
+    top, n = _top_rows(cond, 40)
+    if not n:
+        return (), None, ()
+    titles = ctx["titles_np"]
+    lines = [f"- Row {i + 2}: {titles[i]}" for i in top]
+    return ("106",), "Error 106: Missing SEO Title/Description on rows\n" + "\n".join(lines) + _more(n, 40), ()
+
+def _check_111(df, ctx):
+    """Error 111: SEO Title > ~60 or SEO Description > ~320 characters."""
+    norm, blank = ctx["norm"], ctx["blank"]
+    if "SEO Title" not in df.columns and "SEO Description" not in df.columns:
+        return (), None, ()
+    title_lens = norm.get("SEO Title", blank).str.len()
+    desc_lens = norm.get("SEO Description", blank).str.len()
+    top, n = _top_rows(title_lens.gt(60) | desc_lens.gt(320), 60)  # cap detail lines
+    if not n:
+        return (), None, ()
+    titles = ctx["titles_np"]
+    lines = []
+    for i, tl, dl in zip(top, title_lens.to_numpy()[top], desc_lens.to_numpy()[top]):
+        lines.append(f"- Row {i + 2}: Title='{titles[i]}'  SEO Title len={tl}  SEO Description len={dl}")
+    return ("111",), ("Error 111: SEO Length Limits (Title > 60 or Description > 320)\n"
+                      + "\n".join(lines) + _more(n, 60)), ()
+
+def _check_107(df, ctx):
+    """Error 107: Title* present but Body (HTML) blank."""
+    norm = ctx["norm"]
+    if "Title*" not in df.columns or "Body (HTML)" not in df.columns:
+        return (), None, ()
+    top, n = _top_rows(norm["Title*"].ne("") & norm["Body (HTML)"].eq(""), 40)
+    if not n:
+        return (), None, ()
+    lines = [f"- Row {i + 2}: {t}" for i, t in zip(top, ctx["titles_np"][top])]
+    return ("107",), "Error 107: Missing Body (HTML) on rows\n" + "\n".join(lines) + _more(n, 40), ()
+
+def _check_102_inside(df, ctx):
+    """Error 102: duplicate titles inside the template."""
+    title_lower = ctx["title_lower"]
+    if title_lower is None:
+        return (), None, ()
+    vc = title_lower.value_counts()
+    dups = vc[vc > 1]
+    if dups.empty:
+        return (), None, ()
+    # first spelling seen for each normalised title
+    first = ~title_lower.duplicated() & title_lower.ne("")
+    seen_map = dict(zip(title_lower[first], df["Title*"].astype(str)[first]))
+    dup_inside = [f"- {seen_map.get(k,k)} (x{int(cnt)})" for k, cnt in dups.items()]
+    return ("102",), "Error 102: Duplicate Titles in Template\n" + "\n".join(dup_inside), ()
+
+def _check_112(df, ctx):
+    """Error 112: very short or placeholder Body (HTML)."""
+    norm = ctx["norm"]
+    if "Body (HTML)" not in df.columns:
+        return (), None, ()
+    # same cleanup as _looks_like_placeholder_body, one column at a time
+    cleaned = (norm["Body (HTML)"].str.lower()
+               .str.replace(_HTML_TAG_RE.pattern, "", regex=True)
+               .str.replace("&nbsp;", " ", regex=False)
+               .str.replace("&#160;", " ", regex=False)
+               .str.replace(_WS_RE.pattern, " ", regex=True)
+               .str.strip())
+    # blank is Error 107, so only non-empty bodies are evaluated
+    placeholder_mask = cleaned.ne("") & (
+        cleaned.str.len().lt(20)
+        | cleaned.str.contains(_PLACEHOLDER_RE.pattern, regex=True)
+        | cleaned.str.fullmatch(_PUNCT_ONLY_RE.pattern)
+    )
+    top, n = _top_rows(placeholder_mask, 60)  # cap detail lines for dialog
+    if not n:
+        return (), None, ()
+    lines = [f"- Row {i + 2}: {t}" for i, t in zip(top, ctx["titles_np"][top])]
+    return ("112",), ("Error 112: Very Short/Placeholder Description\n"
+                      + "\n".join(lines) + _more(n, 60)), ()
+
+def _check_102_export(df, ctx):
+    """Error 102: titles that already exist in the previous export."""
+    prev_titles_set, title_lower = ctx.get("prev_titles"), ctx["title_lower"]
+    if not prev_titles_set or title_lower is None:
+        return (), None, ()
+    hits = df["Title*"].astype(str)[title_lower.ne("") & title_lower.isin(prev_titles_set)]
+    if hits.empty:
+        return (), None, ()
+    dup_against_export = sorted(set(("- " + hits).tolist()))[:50]
+    return ("102",), "Error 102: Titles already exist in Previous Export\n" + "\n".join(dup_against_export), ()
+
+def _check_109(df, ctx):
+    """Error 109: bad handle format (blank is fine, it's optional)."""
+    if "Handle (optional)" not in df.columns:
+        return (), None, ()
+    col = ctx["norm"]["Handle (optional)"]
+    nonempty = col.ne("")
+    good = col.str.fullmatch(_HANDLE_RE.pattern, na=False).fillna(False) & col.str.len().le(255)
+    top, n = _top_rows(nonempty & ~good, 60)  # cap to avoid huge dialog
+    if not n:
+        return (), None, ()
+    # take just the reported rows from both columns in one go
+    sub = zip(top.tolist(), ctx["titles_np"][top].tolist(), col.iloc[top].tolist())
+    block = "\n".join([f"- Row {i + 2}: {title} — handle='{bad}'" for i, title, bad in sub])
+    return ("109",), "Error 109: Bad Handle Format\n" + block + _more(n, 60), ()
+
+def _check_101(df, ctx):
+    """Error 101: broken image links (network bound)."""
+    img_cols = {f"Image URL {n}": n for n in range(1,9) if f"Image URL {n}" in df.columns}
+    if not img_cols:
+        return (), None, ()
+    # long format, column by column (same order as the report): index = sheet row
+    long = df[list(img_cols)].melt(ignore_index=False, var_name="col", value_name="url")
+    # strip once in bulk; the stripped link is what gets probed, deduped and reported
+    urls = long["url"].str.strip()
+    long = long.assign(url=urls)[urls.ne("")]
+    if long.empty:
+        return (), None, ()
+    titles = ctx["titles_np"][long.index.to_numpy()]
+    to_check = list(zip(long["col"].map(img_cols).tolist(), titles.tolist(), long["url"].tolist()))
+    # each distinct link is probed once; results fan back out to every cell using it
+    results = check_image_urls(long["url"].drop_duplicates().tolist(), max_workers=32)
+    broken_lines, broken_titles = [], set()
+    for n, title, url in to_check:
+        ok, note = results[url]
+        if not ok:
+            broken_lines.append(f"- [{n}] {title} => {url} ({note})")
+            if title.strip():
+                broken_titles.add(title.strip())
+    if not broken_lines:
+        return (), None, ()
+    return ("101",), "Error 101: Broken Image Link\n" + "\n".join(broken_lines[:200]), tuple(broken_titles)
+
+# report order of the independent checks (Error 102 vs. previous export is
+# slotted in after 112 once the export has been read)
+_PREFLIGHT_CHECKS = (_check_105, _check_110, _check_108, _check_106, _check_111,
+                     _check_107, _check_102_inside, _check_112)
+_PREFLIGHT_CHECKS_LATE = (_check_109, _check_101)
 
 # ===== “How to fix” tips =====
 def build_fix_tips(active_codes):
@@ -414,10 +972,8 @@ def build_fix_tips(active_codes):
 
 def sanitize_filename_part(s: str) -> str:
     """Remove Windows-illegal filename chars and trim length."""
-    import re
-    s = str(s or "").strip()
-    s = re.sub(r'[<>:"/\\|?*]+', "-", s)
-    s = re.sub(r"\s+", " ", s)
+    s = _strip(s).translate(_WIN_BAD_TABLE)
+    s = " ".join(s.split())
     return s[:80] if s else s
 
 # ============ Small helpers (UI) ============
@@ -475,6 +1031,7 @@ class LoginFrame(ttk.Frame):
         self.password = tk.StringVar(value="")
         self.remember = tk.BooleanVar(value=self.cfg.get("remember_last_user", False))
         self.show_pwd = tk.BooleanVar(value=False)
+        self._debounce_ids = {}
 
         self._build_ui()
 
@@ -496,7 +1053,7 @@ class LoginFrame(ttk.Frame):
             self.bg.coords("card", w // 2, h // 2)
             card.config(width=cw, height=ch)
 
-        self.bg.bind("<Configure>", _center_card)
+        self.bg.bind("<Configure>", lambda e: self._debounce("card", _center_card))
 
         # Split card into two columns
         card.grid_propagate(False)
@@ -511,8 +1068,35 @@ class LoginFrame(ttk.Frame):
         self._left_bg_img = None
         self._left_logo_img = None
         self._logo_float_phase = 0.0
+        self._bg_cache_key = None
+        self._logo_dy = None
+        TARGET_W, TARGET_H = 200, 100
 
-        def _draw_left(_evt=None):
+        def _load_logo():
+            logo_path = resource_path("amsons.png")
+            if not os.path.exists(logo_path):
+                return None
+            try:
+                if _HAS_PIL:
+                    img0 = Image.open(logo_path).convert("RGBA").resize((TARGET_W, TARGET_H), Image.LANCZOS)
+                    return ImageTk.PhotoImage(img0)
+                img_obj = tk.PhotoImage(file=logo_path)
+                if img_obj.height() > TARGET_H:
+                    f = max(1, img_obj.height() // TARGET_H)
+                    img_obj = img_obj.subsample(f, f)
+                return img_obj
+            except Exception:
+                return None
+
+        def _logo_xy(w, h):
+            # float the logo slightly up/down
+            dy = int(6 * math.sin(self._logo_float_phase))
+            cx, cy = w // 2, int(h * 0.42) + dy
+            title_y = cy + (TARGET_H // 2 + 20 if self._left_logo_img else 0)
+            return dy, cx, cy, title_y
+
+        def _redraw_bg(_evt=None):
+            # full redraw: only on <Configure>
             left.delete("all")
             w, h = max(1, left.winfo_width()), max(1, left.winfo_height())
 
@@ -524,66 +1108,68 @@ class LoginFrame(ttk.Frame):
                     bg_path = p
                     break
 
+            drawn = False
             if _HAS_PIL and bg_path:
                 try:
-                    bg0 = Image.open(bg_path).convert("RGB")
-                    bw, bh = bg0.size
-                    scale = max(w / float(bw), h / float(bh))
-                    bg0 = bg0.resize((int(bw*scale), int(bh*scale)), Image.LANCZOS)
-                    x0 = (bg0.size[0] - w) // 2
-                    y0 = (bg0.size[1] - h) // 2
-                    bg0 = bg0.crop((x0, y0, x0 + w, y0 + h))
-                    # subtle darken for better contrast
-                    enhancer = ImageEnhance.Brightness(bg0)
-                    bg0 = enhancer.enhance(0.7)
-                    self._left_bg_img = ImageTk.PhotoImage(bg0)
+                    key = (w, h, bg_path)
+                    if self._bg_cache_key != key:
+                        bg0 = Image.open(bg_path).convert("RGB")
+                        bw, bh = bg0.size
+                        scale = max(w / float(bw), h / float(bh))
+                        bg0 = bg0.resize((int(bw*scale), int(bh*scale)), Image.LANCZOS)
+                        x0 = (bg0.size[0] - w) // 2
+                        y0 = (bg0.size[1] - h) // 2
+                        bg0 = bg0.crop((x0, y0, x0 + w, y0 + h))
+                        # subtle darken for better contrast
+                        enhancer = ImageEnhance.Brightness(bg0)
+                        bg0 = enhancer.enhance(0.7)
+                        self._left_bg_img = ImageTk.PhotoImage(bg0)
+                        self._bg_cache_key = key
                     left.create_image(0, 0, image=self._left_bg_img, anchor="nw")
+                    drawn = True
                 except Exception:
-                    draw_vertical_gradient(left, "#000000", "#000000")
-            else:
+                    self._bg_cache_key = None
+            if not drawn:
                 draw_vertical_gradient(left, "#000000", "#000000")
 
-            # Logo 200x100 centered
-            TARGET_W, TARGET_H = 200, 100
-            cx = w // 2
-            # float the logo slightly up/down
-            dy = int(6 * math.sin(self._logo_float_phase))
-            cy = int(h * 0.42) + dy
-            logo_path = resource_path("amsons.png")
-            img_obj = None
-            if os.path.exists(logo_path):
-                try:
-                    if _HAS_PIL:
-                        img0 = Image.open(logo_path).convert("RGBA").resize((TARGET_W, TARGET_H), Image.LANCZOS)
-                        img_obj = ImageTk.PhotoImage(img0)
-                    else:
-                        img_obj = tk.PhotoImage(file=logo_path)
-                        if img_obj.height() > TARGET_H:
-                            f = max(1, img_obj.height() // TARGET_H)
-                            img_obj = img_obj.subsample(f, f)
-                except Exception:
-                    img_obj = None
-
-            self._left_logo_img = img_obj
+            # Logo 200x100 centered (decoded once)
+            if self._left_logo_img is None:
+                self._left_logo_img = _load_logo()
+            self._logo_dy, cx, cy, title_y = _logo_xy(w, h)
             if self._left_logo_img:
-                left.create_image(cx, cy, image=self._left_logo_img, anchor="center")
+                left.create_image(cx, cy, image=self._left_logo_img, anchor="center", tags=("logo",))
 
             # Title
-            title_y = cy + (TARGET_H // 2 + 20 if self._left_logo_img else 0)
             left.create_text(
                 cx, title_y,
                 text="Amsons Shopify Bulk Product Import Generator",
                 fill="white",
-                font=("Segoe UI Semibold", 18)
+                font=("Segoe UI Semibold", 18),
+                tags=("title",)
             )
 
+        def _redraw_logo():
+            # per tick: just move the logo/title items
+            w, h = max(1, left.winfo_width()), max(1, left.winfo_height())
+            dy, cx, cy, title_y = _logo_xy(w, h)
+            if dy == self._logo_dy:
+                return
+            self._logo_dy = dy
+            left.coords("logo", cx, cy)
+            left.coords("title", cx, title_y)
+
         def _tick():
+            if not self.winfo_exists():
+                return
+            if not self.winfo_viewable():
+                self.after(250, _tick)
+                return
             # animate logo float
             self._logo_float_phase += 0.06
-            _draw_left()
+            _redraw_logo()
             self.after(50, _tick)
 
-        left.bind("<Configure>", _draw_left)
+        left.bind("<Configure>", lambda e: self._debounce("left", _redraw_bg))
         self.after(200, _tick)
 
         # RIGHT: white panel with uniform padding
@@ -636,6 +1222,14 @@ class LoginFrame(ttk.Frame):
         self.pw_entry.bind("<Return>", lambda e: self._login())
         self.bind_all("<Escape>", lambda e: self.master.focus_set())
 
+    def _debounce(self, key, fn, delay=80):
+        """Coalesce bursts of <Configure> events: only the last one within `delay` ms runs `fn`."""
+        pending = self._debounce_ids.pop(key, None)
+        if pending:
+            try: self.after_cancel(pending)
+            except Exception: pass
+        self._debounce_ids[key] = self.after(delay, fn)
+
     def _toggle_pwd(self):
         self.pw_entry.config(show="" if self.show_pwd.get() else "•")
 
@@ -691,11 +1285,11 @@ class LoginFrame(ttk.Frame):
 
             cfg = load_config()
             users = cfg.get("users", [])
-            if any(rec.get("username") == user for rec in users):
+            if user in cfg["users_by_name"]:
                 messagebox.showerror(APP_TITLE, "This username already exists. Choose another.")
                 return
 
-            users.append({"username": user, "password": pw})
+            users.append({"username": user, **hash_password(pw)})
             cfg["users"] = users
             save_config(cfg)
 
@@ -717,18 +1311,15 @@ class LoginFrame(ttk.Frame):
         u = self.username.get().strip()
         p = self.password.get().strip()
 
-        ok = False
-        for rec in load_config().get("users", []):
-            if rec.get("username") == u and rec.get("password") == p:
-                ok = True
-                break
-
-        if not ok:
+        cfg = load_config()
+        rec = cfg["users_by_name"].get(u) if u else None
+        if not verify_password(rec, p):
             messagebox.showerror(APP_TITLE, "Invalid username or password.")
             return
+        if "hash" not in rec:
+            set_password(rec, p)  # migrate legacy plaintext entry
 
         # Remember choice
-        cfg = load_config()
         cfg["remember_last_user"] = bool(self.remember.get())
         cfg["last_user"] = u if self.remember.get() else ""
         save_config(cfg)
@@ -741,15 +1332,22 @@ class LoginFrame(ttk.Frame):
         self.on_login(u)
 
     def _speak(self, text):
+        if not _HAS_TTS:
+            return
         try:
-            eng = pyttsx3.init()
-            eng.say(text)
-            eng.runAndWait()
+            with _TTS_LOCK:
+                eng = _get_tts()
+                eng.say(text)
+                eng.runAndWait()
         except Exception:
             pass
 
 
 class DashboardFrame(ttk.Frame):
+    FRAME_BUDGET = 0.033  # seconds between header frames (~30 fps cap)
+    MAX_LOG_LINES = 5000  # live log keeps only the newest lines
+    PROG_INTERVAL = 80    # ms per indeterminate progress step
+
     def __init__(self, master, username: str):
         super().__init__(master)
         self.master = master
@@ -761,6 +1359,9 @@ class DashboardFrame(ttk.Frame):
         self.prev_path = tk.StringVar(value="")
         self.out_dir = tk.StringVar(value=str(Path.cwd() / "out"))
         self.sheet_name = tk.StringVar(value="Products")
+        self._prev_cache = {}
+        self._df_cache = {}
+        self.bind("<<ValidationDone>>", self._on_validation_done)
         self.respect_existing = tk.BooleanVar(value=True)
         self.status_choice = tk.StringVar(value="active")
         self.proceed_despite_errors = tk.BooleanVar(value=False)
@@ -769,6 +1370,9 @@ class DashboardFrame(ttk.Frame):
 
         self.proc = None
         self.q = queue.Queue()
+        self._log_buf = collections.deque()
+        self._log_pending = False
+        self._log_lines = 0
         self.phase = "idle"
         self._last_exit_code = None
         self._current_outdir = None
@@ -783,8 +1387,17 @@ class DashboardFrame(ttk.Frame):
         self.header = tk.Canvas(self, height=150, highlightthickness=0, bd=0, bg="#000")
         self.header.pack(fill="x")
         self.header.bind("<Configure>", self._redraw_header)
-        self.logo_img = None
-        self.after(40, self._animate_header)  # shimmer animation
+        self._logo_cache = {}
+        self.logo_img = self._load_header_logo()
+        self._header_size = None
+        self._redraw_after_id = None
+        self._shimmer_item = None
+        self._anim_on = True
+        self._anim_after_id = None
+        self._last_draw = 0.0
+        self.bind("<Unmap>", self._on_unmap)
+        self.bind("<Map>", self._on_map)
+        self._schedule_header(40)  # shimmer animation
 
         # Main layout with side nav + content card
         container = tk.Frame(self, bg=UI.BG)
@@ -894,40 +1507,64 @@ class DashboardFrame(ttk.Frame):
         self.status_bar.pack(fill="x")
 
     # ----- header -----
+    def _load_header_logo(self, max_h=80):
+        # decoded/resized once per (file, mtime, height); resizes and shimmer ticks reuse it
+        logo_path = resource_path("amsons.png")
+        try:
+            key = (logo_path, os.path.getmtime(logo_path), max_h)
+        except OSError:
+            return None
+        if key in self._logo_cache:
+            return self._logo_cache[key]
+        self._logo_cache.clear()
+        img = self._logo_cache[key] = self._decode_header_logo(logo_path, max_h)
+        return img
+
+    def _decode_header_logo(self, logo_path, max_h):
+        try:
+            if _HAS_PIL:
+                img0 = Image.open(logo_path).convert("RGBA")
+                W,H = img0.size
+                if H > max_h:
+                    scale = max_h/float(H)
+                    img0 = img0.resize((int(W*scale), int(H*scale)), Image.LANCZOS)
+                return ImageTk.PhotoImage(img0)
+            img = tk.PhotoImage(file=logo_path)
+            if img.height()>max_h:
+                factor = max(2, img.height()//max_h)
+                img = img.subsample(factor, factor)
+            return img
+        except Exception:
+            return None
+
+    def _shimmer_color(self):
+        t = (math.sin(self._header_anim_t) + 1) / 2  # 0..1
+        return blend_hex("#000000", "#222222", t)
+
     def _redraw_header(self, _evt=None):
+        # <Configure> storms during drag-resize: redraw once, 50 ms after the last one
+        if self._redraw_after_id:
+            try: self.after_cancel(self._redraw_after_id)
+            except Exception: pass
+        self._redraw_after_id = self.after(50, self._redraw_header_now)
+
+    def _redraw_header_now(self):
+        # static layer: rebuilt only when the header size changes
+        self._redraw_after_id = None
         c = self.header
-        c.delete("all")
         w,h = c.winfo_width(), c.winfo_height()
+        if (w, h) == self._header_size:
+            return
+        self._header_size = (w, h)
+        c.delete("all")
+        self.logo_img = self._load_header_logo()
 
-        # animated shimmer across black
-        t = (math.sin(self._header_anim_t) + 1) / 2  # 0..1
-        top = blend_hex("#000000", "#111111", t*0.6)
-        bot = blend_hex("#000000", "#161616", t*0.6)
-        for i in range(max(1,h)):
-            u = i/float(h-1) if h>1 else 0
-            c.create_line(0,i,w,i,fill=blend_hex(top,bot,u))
+        draw_vertical_gradient(c, "#000000", "#0d0d0d")
+        # animated shimmer across black: the only item touched per frame
+        self._shimmer_item = c.create_rectangle(0, 0, w, h, fill=self._shimmer_color(),
+                                                outline="", stipple="gray25")
 
         # center logo
-        logo_path = resource_path("amsons.png")
-        img = None
-        if os.path.exists(logo_path):
-            try:
-                if _HAS_PIL:
-                    img0 = Image.open(logo_path).convert("RGBA")
-                    max_h = 80
-                    W,H = img0.size
-                    if H > max_h:
-                        scale = max_h/float(H)
-                        img0 = img0.resize((int(W*scale), int(H*scale)), Image.LANCZOS)
-                    img = ImageTk.PhotoImage(img0)
-                else:
-                    img = tk.PhotoImage(file=logo_path)
-                    if img.height()>80:
-                        factor = max(2, img.height()//80)
-                        img = img.subsample(factor, factor)
-            except Exception:
-                img = None
-        self.logo_img = img
         cy = int(h*0.52)
         if self.logo_img:
             c.create_image(w//2, cy+8, image=self.logo_img, anchor="s")
@@ -939,11 +1576,43 @@ class DashboardFrame(ttk.Frame):
         c.create_text(w//2, y+35, text="Import builder • validator • image checks",
                       fill="#E9FFFB", font=("Segoe UI", 10), anchor="n")
 
+    def _schedule_header(self, delay):
+        # keep a single pending animation callback
+        if self._anim_after_id:
+            try: self.after_cancel(self._anim_after_id)
+            except Exception: pass
+        self._anim_after_id = self.after(delay, self._animate_header)
+
+    def _on_unmap(self, _evt=None):
+        self._anim_on = False
+        self.prog.stop()
+
+    def _on_map(self, _evt=None):
+        self._anim_on = True
+        self._schedule_header(0)
+        if self.phase != "idle":
+            self.prog.start(self.PROG_INTERVAL)
+
     def _animate_header(self):
+        self._anim_after_id = None
+        if not self.winfo_exists():
+            return
+        # idle while minimized/hidden
+        if not self._anim_on or not self.winfo_viewable():
+            self._schedule_header(200)
+            return
+        # never draw faster than the frame budget (e.g. after an event-loop stall)
+        now = time.perf_counter()
+        dt = now - self._last_draw
+        if dt < self.FRAME_BUDGET:
+            self._schedule_header(int((self.FRAME_BUDGET - dt) * 1000) + 1)
+            return
+        self._last_draw = now
         # gentle shimmer
         self._header_anim_t += 0.04
-        self._redraw_header()
-        self.after(50, self._animate_header)
+        if self._shimmer_item is not None:
+            self.header.itemconfigure(self._shimmer_item, fill=self._shimmer_color())
+        self._schedule_header(50)
 
     # ----- pickers -----
     def _pick_script(self):
@@ -974,7 +1643,7 @@ class DashboardFrame(ttk.Frame):
         cols = self._make_template_columns()
         rows = self._make_template_example_rows(cols)
         try:
-            if Path(path).suffix.lower() == ".csv" or pd is None:
+            if Path(path).suffix.lower() == ".csv" or openpyxl is None:
                 self._save_template_csv(path, cols, rows)
                 messagebox.showinfo(APP_TITLE, f"Template (CSV) saved with examples:\n{path}")
                 self._log(f"New template saved (CSV): {path}")
@@ -1032,41 +1701,29 @@ class DashboardFrame(ttk.Frame):
 
     def _save_template_csv(self, path: str, columns, rows):
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(f, fieldnames=columns)
-            writer.writeheader()
-            for r in rows:
-                writer.writerow(r)
+        with open(path, "w", newline="", encoding="utf-8-sig", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(columns)
+            writer.writerows([r.get(c, "") for c in columns] for r in rows)
 
     def _save_template_excel(self, path: str, columns, rows, sheet_name: str):
-        if pd is None:
-            raise RuntimeError("pandas is required to write XLSX. Choose CSV or install: pip install pandas openpyxl")
-        import importlib
-        engine = None
-        try:
-            importlib.import_module("openpyxl")
-            engine = "openpyxl"
-        except Exception:
-            engine = None
-        df = pd.DataFrame(rows, columns=columns)
+        if openpyxl is None:
+            raise RuntimeError("openpyxl is required to write XLSX. Choose CSV or install: pip install openpyxl")
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        with pd.ExcelWriter(path, engine=engine) as xw:
-            df.to_excel(xw, index=False, sheet_name=sheet_name)
-        try:
-            import openpyxl
-            wb = openpyxl.load_workbook(path)
-            ws = wb[sheet_name]
-            ws.freeze_panes = "A2"
-            width_map = {
-                "A": 28, "B": 18, "C": 40, "D": 24, "E": 28,
-                "F": 40, "G": 16, "H": 16, "I": 24, "J": 18
-            }
-            for col, w in width_map.items():
-                if col in ws.column_dimensions:
-                    ws.column_dimensions[col].width = w
-            wb.save(path)
-        except Exception:
-            pass
+        # streaming writer: layout has to be set before the first append
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet(sheet_name)
+        ws.freeze_panes = "A2"
+        width_map = {
+            "A": 28, "B": 18, "C": 40, "D": 24, "E": 28,
+            "F": 40, "G": 16, "H": 16, "I": 24, "J": 18
+        }
+        for col, w in width_map.items():
+            ws.column_dimensions[col].width = w
+        ws.append(list(columns))
+        for r in rows:
+            ws.append([r.get(c, "") or None for c in columns])
+        wb.save(path)
 
     # ----- GUIDELINES (PowerPoint) -----
     def _guidelines(self):
@@ -1080,7 +1737,7 @@ class DashboardFrame(ttk.Frame):
                 messagebox.showinfo(APP_TITLE, "No file selected.")
                 return
             try:
-                shutil.copyfile(src, storage)
+                _fast_copy(src, storage)
             except Exception as e:
                 messagebox.showerror(APP_TITLE, f"Failed to store the Guidelines file:\n\n{e}")
                 return
@@ -1095,7 +1752,7 @@ class DashboardFrame(ttk.Frame):
         if not dest:
             return
         try:
-            shutil.copyfile(storage, dest)
+            _fast_copy(storage, dest)
             self._log(f"Guidelines saved to: {dest}")
             messagebox.showinfo(APP_TITLE, f"Guide lines saved:\n{dest}")
         except Exception as e:
@@ -1161,19 +1818,51 @@ class DashboardFrame(ttk.Frame):
         self.btn_open_out.config(state="disabled")
         self._clear_log(); self._log("Starting validation...\n\n")
         self.status_bar.config(text="Validating...")
-        self.prog.start(12); self.phase = "preflight"
+        self.prog.start(self.PROG_INTERVAL); self.phase = "preflight"
+        clear_image_check_cache()
         t = threading.Thread(
             target=self._worker_preflight,
             args=(self.input_path.get().strip(), self.sheet_name.get().strip() or "Products", self.prev_path.get().strip()),
             daemon=True
         )
         t.start()
-        self.after(50, self._poll_validation_only)
+        # completion arrives as <<ValidationDone>>; the slow poll only forwards progress lines
+        self.after(200, self._poll_validation_only)
+
+    def _load_prev_export(self, prev_path: Path) -> dict:
+        """Read the previous export once per (path, mtime); re-validation reuses the summary."""
+        try:
+            key = (str(prev_path), prev_path.stat().st_mtime_ns)
+        except OSError as e:
+            return {"error": e}
+        hit = self._prev_cache.get(key)
+        if hit is not None:
+            return hit
+        try:
+            # only Title (Error 102) and Variant SKU (Error 103) are needed
+            if prev_path.suffix.lower() in {".xlsx",".xls"}:
+                p = _read_products_sheet(prev_path, usecols=_PREV_EXPORT_COLS)
+            else:
+                head = pd.read_csv(prev_path, dtype=str, nrows=0)
+                # keep one column even if neither is there so the row count still works
+                use = [c for c in _PREV_EXPORT_COLS if c in head.columns] or list(head.columns[:1])
+                p = _read_csv_str(prev_path, usecols=use) if use else head
+            info = {"rows": 0 if p is None else len(p), "titles": frozenset(), "highest": 0}
+            if info["rows"]:
+                if "Title" in p.columns:
+                    info["titles"] = frozenset(p["Title"].fillna("").astype(str).str.strip().str.lower())
+                if "Variant SKU" in p.columns:
+                    info["highest"] = _highest_base_from_skus(p["Variant SKU"])
+        except Exception as e:
+            return {"error": e}
+        self._prev_cache.clear()  # only the latest file is worth keeping
+        self._prev_cache[key] = info
+        return info
 
     def _worker_preflight(self, inp_path: str, sheet: str, prev_path_str: str):
         try:
             try:
-                df = pd.read_excel(inp_path, sheet_name=sheet, dtype=str)
+                df = _read_products_sheet(inp_path, sheet)
             except Exception as e:
                 self.q.put(("__VALIDATION_FAIL__", {
                     "detail": f"Error 104: Blank/Unreadable Import Sheet\nCannot read sheet '{sheet}' in '{inp_path}'.\n\n{e}",
@@ -1181,265 +1870,59 @@ class DashboardFrame(ttk.Frame):
                     "broken_titles": []
                 }))
                 return
-            df = df.fillna("")
-            total = int(df["Title*"].astype(str).str.strip().ne("").sum()) if "Title*" in df.columns else 0
+            df = df.fillna("").astype(_STR_DTYPE)
+            # normalise each checked column once; every check below reads from here
+            norm = {c: df[c].str.strip() for c in _PREFLIGHT_COLS if c in df.columns}
+            blank = pd.Series("", index=df.index, dtype=object)  # scalar fill, no N-item list
+            title_lower = norm["Title*"].str.lower() if "Title*" in norm else None
+            total = int(norm["Title*"].ne("").sum()) if "Title*" in norm else 0
 
             codes = set()
             sections = []
             broken_titles_set = set()
 
-            # Error 104: empty import sheet
+            # Error 104: empty import sheet -- nothing else can be meaningfully checked
             if df.empty or total == 0:
-                codes.add("104")
-                sections.append("Error 104: Blank/Empty Import\n- The input sheet has no products with non-empty Title*.")
-
-            # Error 105: missing mandatory
-            miss_msgs = []
-            if "Title*" not in df.columns or "Vendor*" not in df.columns or "Variant Price*" not in df.columns:
-                codes.add("105")
-                missing_cols = [c for c in ["Title*","Vendor*","Variant Price*"] if c not in df.columns]
-                miss_msgs.append(f"- Missing required column(s): {', '.join(missing_cols)}")
-            else:
-                miss_t = df.index[df["Title*"].astype(str).str.strip() == ""].tolist()
-                miss_v = df.index[df["Vendor*"].astype(str).str.strip() == ""].tolist()
-                miss_p = df.index[df["Variant Price*"].astype(str).str.strip() == ""].tolist()
-                if miss_t: miss_msgs.append(f"- Missing Title* on rows: {', '.join(str(i+2) for i in miss_t)}")
-                if miss_v: miss_msgs.append(f"- Missing Vendor* on rows: {', '.join(str(i+2) for i in miss_v)}")
-                if miss_p: miss_msgs.append(f"- Missing Variant Price* on rows: {', '.join(str(i+2) for i in miss_p)}")
-                if miss_t or miss_v or miss_p:
-                    codes.add("105")
-            if miss_msgs:
-                sections.append("Error 105: Mandatory fields missing\n" + "\n".join(miss_msgs))
-
-            # Error 110: Variant Options Mismatch (Option1 Name/Values must be paired)
-            if "Option1 Name" in df.columns or "Option1 Values" in df.columns:
-                name_series = df.get("Option1 Name", pd.Series([""] * len(df))).astype(str).str.strip()
-                vals_series = df.get("Option1 Values", pd.Series([""] * len(df))).astype(str).str.strip()
-
-                mism_idxs = []
-                for i in range(len(df)):
-                    has_name = bool(name_series.iat[i])
-                    has_vals = bool(vals_series.iat[i])
-                    # flag if exactly one is present
-                    if has_name ^ has_vals:
-                        mism_idxs.append(i)
-
-                if mism_idxs:
-                    codes.add("110")
-                    lines = []
-                    for i in mism_idxs[:60]:  # cap lines for dialog length
-                        rowno = i + 2
-                        title = df.at[i, "Title*"] if "Title*" in df.columns else ""
-                        n = name_series.iat[i]
-                        v = vals_series.iat[i]
-                        lines.append(f"- Row {rowno}: Title='{title}'  Option1 Name='{n}'  Option1 Values='{v}'")
-                    more = f"\n  ... and {len(mism_idxs) - 60} more row(s)" if len(mism_idxs) > 60 else ""
-                    sections.append("Error 110: Variant Options Mismatch (Option1)\n" + "\n".join(lines) + more)
-
-            # Error 108: invalid price tokens (non-numeric, zero, or negative)
-            if "Variant Price*" in df.columns:
-                invalid_idxs = []
-                col = df["Variant Price*"].astype(str)
-                for i, val in col.items():
-                    s = str(val).strip()
-                    # Skip blanks here (already handled by Error 105 missing mandatory)
-                    if not s:
-                        continue
-                    if not is_valid_positive_price_token(s):
-                        invalid_idxs.append(i)
-
-                if invalid_idxs:
-                    codes.add("108")
-                    lines = []
-                    for i in invalid_idxs[:60]:  # show first 60 rows to keep dialog small
-                        title = df.at[i, "Title*"] if "Title*" in df.columns else ""
-                        lines.append(f"- Row {i + 2}: {title} — price='{str(df.at[i, 'Variant Price*']).strip()}'")
-                    more = f"\n  ... and {len(invalid_idxs) - 60} more row(s)" if len(invalid_idxs) > 60 else ""
-                    sections.append("Error 108: Invalid Price\n" + "\n".join(lines) + more)
-
-            # Error 106: missing SEO Title/Description on any row
-            present_seo_cols = [c for c in ["SEO Title", "SEO Description"] if c in df.columns]
-            if present_seo_cols:
-                cond = False
-                for c in present_seo_cols:
-                    series = df[c].astype(str).str.strip()
-                    cond = series.eq("") if cond is False else (cond | series.eq(""))
-                if cond is not False:
-                    idxs = list(df.index[cond])
-                    if idxs:
-                        codes.add("106")
-                        lines = []
-                        for i in idxs[:40]:
-                            title = df.at[i, "Title*"] if "Title*" in df.columns else ""
-                            rowno = i + 2
-                            lines.append(f"- Row {rowno}: {title}")
-                        more = f"\n  ... and {len(idxs)-40} more row(s)" if len(idxs) > 40 else ""
-                        sections.append("Error 106: Missing SEO Title/Description on rows\n" + "\n".join(lines) + more)
-
-                # Error 111: SEO Length Limits (Title > ~60 or Description > ~320)
-                if "SEO Title" in df.columns or "SEO Description" in df.columns:
-                    st = df.get("SEO Title", pd.Series([""] * len(df))).astype(str)
-                    sd = df.get("SEO Description", pd.Series([""] * len(df))).astype(str)
-
-                    over_idxs = []
-                    for i in range(len(df)):
-                        title_len = len(st.iat[i].strip())
-                        desc_len = len(sd.iat[i].strip())
-                        if (title_len > 60) or (desc_len > 320):
-                            over_idxs.append((i, title_len, desc_len))
-
-                    if over_idxs:
-                        codes.add("111")
-                        lines = []
-                        for (i, tl, dl) in over_idxs[:60]:  # cap detail lines
-                            rowno = i + 2
-                            title = df.at[i, "Title*"] if "Title*" in df.columns else ""
-                            lines.append(
-                                f"- Row {rowno}: Title='{title}'  SEO Title len={tl}  SEO Description len={dl}")
-                        more = f"\n  ... and {len(over_idxs) - 60} more row(s)" if len(over_idxs) > 60 else ""
-                        sections.append("Error 111: SEO Length Limits (Title > 60 or Description > 320)\n" + "\n".join(
-                            lines) + more)
-
-            # Error 107: Title* present but Body (HTML) blank
-            if "Title*" in df.columns and "Body (HTML)" in df.columns:
-                title_nonempty = df["Title*"].astype(str).str.strip().ne("")
-                body_blank = df["Body (HTML)"].astype(str).str.strip().eq("")
-                idxs = list(df.index[title_nonempty & body_blank])
-                if idxs:
-                    codes.add("107")
-                    lines = []
-                    for i in idxs[:40]:
-                        t = df.at[i, "Title*"]
-                        lines.append(f"- Row {i+2}: {t}")
-                    more = f"\n  ... and {len(idxs)-40} more row(s)" if len(idxs) > 40 else ""
-                    sections.append("Error 107: Missing Body (HTML) on rows\n" + "\n".join(lines) + more)
-
-            # Error 102: duplicate titles inside template
-            dup_inside = []
-            if "Title*" in df.columns:
-                tnorm = df["Title*"].astype(str).str.strip().str.lower()
-                vc = tnorm.value_counts()
-                dups = vc[vc > 1]
-                if not dups.empty:
-                    seen_map = {}
-                    for t in df["Title*"].astype(str):
-                        k = t.strip().lower()
-                        if k and k not in seen_map:
-                            seen_map[k] = t
-                    for k,cnt in dups.items():
-                        dup_inside.append(f"- {seen_map.get(k,k)} (x{int(cnt)})")
-            if dup_inside:
-                codes.add("102")
-                sections.append("Error 102: Duplicate Titles in Template\n" + "\n".join(dup_inside))
-
-            # Error 112: Very Short/Placeholder Description
-            if "Body (HTML)" in df.columns:
-                idxs_placeholder = []
-                body_series = df["Body (HTML)"].astype(str)
-                title_series = df.get("Title*", pd.Series([""] * len(df))).astype(str)
-
-                for i in range(len(df)):
-                    body = body_series.iat[i]
-                    title = title_series.iat[i].strip()
-                    if body.strip():  # only evaluate if something is present; blank is Error 107
-                        if _looks_like_placeholder_body(body):
-                            idxs_placeholder.append(i)
-
-                if idxs_placeholder:
-                    codes.add("112")
-                    lines = []
-                    for i in idxs_placeholder[:60]:  # cap detail lines for dialog
-                        rowno = i + 2
-                        t = title_series.iat[i] if i < len(title_series) else ""
-                        lines.append(f"- Row {rowno}: {t}")
-                    more = f"\n  ... and {len(idxs_placeholder) - 60} more row(s)" if len(idxs_placeholder) > 60 else ""
-                    sections.append("Error 112: Very Short/Placeholder Description\n" + "\n".join(lines) + more)
-
-            # Error 102 also: duplicates against previous export titles
-            dup_against_export = []
-            prev_titles_set = set()
+                self.q.put(("__VALIDATION_FAIL__", {
+                    "detail": f"Products found (non-empty Title*): {total}\n\n"
+                              "Error 104: Blank/Empty Import\n- The input sheet has no products with non-empty Title*.",
+                    "codes": ["104"],
+                    "broken_titles": []
+                }))
+                return
+
+            # positional arrays so report formatting never goes through the .at indexer
+            titles_np = (df["Title*"].to_numpy(dtype=object) if "Title*" in df.columns
+                         else np.full(len(df), "", dtype=object))
+            ctx = {"norm": norm, "blank": blank, "title_lower": title_lower, "titles_np": titles_np}
             prev_path = Path(prev_path_str) if prev_path_str else None
-            if prev_path and prev_path.exists():
-                try:
-                    if prev_path.suffix.lower() in {".xlsx",".xls"}:
-                        p = pd.read_excel(prev_path, dtype=str).fillna("")
-                    else:
-                        p = pd.read_csv(prev_path, dtype=str).fillna("")
-                    if "Title" in p.columns:
-                        prev_titles_set = set(p["Title"].astype(str).str.strip().str.lower().tolist())
-                except Exception:
-                    pass
-            if prev_titles_set and "Title*" in df.columns:
-                for t in df["Title*"].astype(str):
-                    k = t.strip().lower()
-                    if k and k in prev_titles_set:
-                        dup_against_export.append(f"- {t}")
-            if dup_against_export:
-                codes.add("102")
-                sections.append("Error 102: Titles already exist in Previous Export\n" + "\n".join(sorted(set(dup_against_export))[:50]))
-
-            # Error 109: bad handle format
-            if "Handle (optional)" in df.columns:
-                bad_idxs = []
-                col = df["Handle (optional)"].astype(str)
-                for i, val in col.items():
-                    s = str(val).strip()
-                    if not s:
-                        continue  # optional; blank is fine
-                    if not is_valid_handle(s):
-                        bad_idxs.append(i)
-
-                if bad_idxs:
-                    codes.add("109")
-                    lines = []
-                    for i in bad_idxs[:60]:  # cap to avoid huge dialog
-                        title = df.at[i, "Title*"] if "Title*" in df.columns else ""
-                        bad = str(df.at[i, "Handle (optional)"]).strip()
-                        lines.append(f"- Row {i + 2}: {title} — handle='{bad}'")
-                    more = f"\n  ... and {len(bad_idxs) - 60} more row(s)" if len(bad_idxs) > 60 else ""
-                    sections.append("Error 109: Bad Handle Format\n" + "\n".join(lines) + more)
-
-            # Error 101: broken images
-            broken_lines = []
-            if "Title*" in df.columns:
-                titles_series = df["Title*"].astype(str)
-            else:
-                titles_series = pd.Series([""]*len(df))
-
-            for n in range(1,9):
-                col = f"Image URL {n}"
-                if col in df.columns:
-                    for idx,url in df[col].astype(str).items():
-                        if url.strip():
-                            title = titles_series.iloc[idx] if idx < len(titles_series) else ""
-                            ok, note = check_image_url(url)
-                            if not ok:
-                                broken_lines.append(f"- [{n}] {title} => {url} ({note})")
-                                if title.strip():
-                                    broken_titles_set.add(title.strip())
-
-            if broken_lines:
-                codes.add("101")
-                sections.append("Error 101: Broken Image Link\n" + "\n".join(broken_lines[:200]))
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+                # slowest work (previous export read, image probes) goes in first
+                prev_fut = pool.submit(self._load_prev_export, prev_path) if prev_path and prev_path.exists() else None
+                late = [pool.submit(chk, df, ctx) for chk in _PREFLIGHT_CHECKS_LATE]
+                futs = [pool.submit(chk, df, ctx) for chk in _PREFLIGHT_CHECKS]
+                prev_info = prev_fut.result() if prev_fut else None
+                ctx["prev_titles"] = prev_info.get("titles") if prev_info else None
+                futs.append(pool.submit(_check_102_export, df, ctx))
+                # collect in submission order so the report reads the same every run
+                for fut in futs + late:
+                    add_codes, section, broken = fut.result()
+                    codes.update(add_codes)
+                    if section:
+                        sections.append(section)
+                    broken_titles_set.update(broken)
 
             # Error 103 / 104 for previous export file
-            if prev_path and prev_path.exists():
-                try:
-                    if prev_path.suffix.lower() in {".xlsx",".xls"}:
-                        p = pd.read_excel(prev_path, dtype=str)
-                    else:
-                        p = pd.read_csv(prev_path, dtype=str)
-                    if p is None or p.empty:
-                        codes.add("104")
-                        sections.append("Error 104: Blank/Empty Previous Export\n- The selected previous export file has no rows.")
-                    else:
-                        highest = load_prev_highest_base(prev_path)
-                        if highest == 0:
-                            codes.add("103")
-                            sections.append("Error 103: Unable to find Highest SKU\n- 'Variant SKU' column missing or contains no valid 6-digit base like 110357/110357-01.")
-                except Exception as e:
+            if prev_info is not None:
+                if "error" in prev_info:
+                    codes.add("103")
+                    sections.append(f"Error 103: Unable to read Previous Export\n- {prev_info['error']}")
+                elif not prev_info["rows"]:
+                    codes.add("104")
+                    sections.append("Error 104: Blank/Empty Previous Export\n- The selected previous export file has no rows.")
+                elif prev_info["highest"] == 0:
                     codes.add("103")
-                    sections.append(f"Error 103: Unable to read Previous Export\n- {e}")
+                    sections.append("Error 103: Unable to find Highest SKU\n- 'Variant SKU' column missing or contains no valid 6-digit base like 110357/110357-01.")
             elif prev_path_str:
                 codes.add("104")
                 sections.append("Error 104: Previous Export not found\n- The selected file path does not exist.")
@@ -1461,46 +1944,64 @@ class DashboardFrame(ttk.Frame):
                 "codes": ["104"],
                 "broken_titles": []
             }))
+        finally:
+            # wake the UI as soon as the result is queued
+            try:
+                self.after(0, lambda: self.event_generate("<<ValidationDone>>", when="tail"))
+            except Exception:
+                pass
+
+    def _on_validation_done(self, _evt=None):
+        if self.phase == "preflight":
+            self._drain_validation_queue()
 
     def _poll_validation_only(self):
-        try:
-            while True:
+        if self.phase != "preflight":
+            return
+        if not self._drain_validation_queue():
+            self.after(200, self._poll_validation_only)
+
+    def _drain_validation_queue(self) -> bool:
+        """Log queued progress lines; True once the final result was handled."""
+        while True:
+            try:
                 msg = self.q.get_nowait()
-                if isinstance(msg, tuple) and msg and msg[0] in {"__VALIDATION_OK__","__VALIDATION_FAIL__"}:
-                    token, payload = msg
-                    self.prog.stop(); self.phase="idle"
-                    self.btn_validate.config(state="normal")
-                    self.btn_run.config(state="normal")
-                    self.btn_open_out.config(state="disabled")
-                    if token == "__VALIDATION_OK__":
-                        self.last_validation = {
-                            "ran": True,
-                            "has_errors": False,
-                            "summary": payload.get("detail","OK"),
-                            "codes": set(),
-                            "broken_titles": set()
-                        }
-                        self.status_bar.config(text="Validation passed.")
-                        messagebox.showinfo(APP_TITLE, "Validation passed. You can Run now.")
-                    else:
-                        codes = set(payload.get("codes", []))
-                        detail = payload.get("detail", "Issues found")
-                        detail = detail + "\n\n" + ("—" * 60) + "\n" + build_fix_tips(codes)
-                        broken_titles = set(payload.get("broken_titles", []))
-                        self.last_validation = {
-                            "ran": True,
-                            "has_errors": True,
-                            "summary": detail,
-                            "codes": codes,
-                            "broken_titles": broken_titles
-                        }
-                        self.status_bar.config(text="Validation found issues.")
-                        self._show_error_dialog(detail)
-                    return
-                else:
-                    self._log(msg if isinstance(msg,str) else str(msg))
-        except queue.Empty:
-            self.after(50, self._poll_validation_only)
+            except queue.Empty:
+                return False
+            if isinstance(msg, tuple) and msg and msg[0] in {"__VALIDATION_OK__","__VALIDATION_FAIL__"}:
+                self._finish_validation(*msg)
+                return True
+            self._log(msg if isinstance(msg,str) else str(msg))
+
+    def _finish_validation(self, token, payload):
+        self.prog.stop(); self.phase="idle"
+        self.btn_validate.config(state="normal")
+        self.btn_run.config(state="normal")
+        self.btn_open_out.config(state="disabled")
+        if token == "__VALIDATION_OK__":
+            self.last_validation = {
+                "ran": True,
+                "has_errors": False,
+                "summary": payload.get("detail","OK"),
+                "codes": set(),
+                "broken_titles": set()
+            }
+            self.status_bar.config(text="Validation passed.")
+            messagebox.showinfo(APP_TITLE, "Validation passed. You can Run now.")
+        else:
+            codes = set(payload.get("codes", []))
+            detail = payload.get("detail", "Issues found")
+            detail = detail + "\n\n" + ("—" * 60) + "\n" + build_fix_tips(codes)
+            broken_titles = set(payload.get("broken_titles", []))
+            self.last_validation = {
+                "ran": True,
+                "has_errors": True,
+                "summary": detail,
+                "codes": codes,
+                "broken_titles": broken_titles
+            }
+            self.status_bar.config(text="Validation found issues.")
+            self._show_error_dialog(detail)
 
     # ----- run -----
     def _run_only(self):
@@ -1550,16 +2051,32 @@ class DashboardFrame(ttk.Frame):
         self.btn_open_out.config(state="disabled")
         self._clear_log(); self._log("Launching builder...\n\n")
         self.status_bar.config(text="Building files...")
-        self.prog.start(12); self.phase="script"
+        self.prog.start(self.PROG_INTERVAL); self.phase="script"
         t = threading.Thread(target=self._worker, args=(args,), daemon=True)
-        t.start(); self.after(50, self._poll_queue)
+        t.start(); self.after(30, self._poll_queue)
 
     def _worker(self, args):
         try:
-            proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, universal_newlines=True)
+            proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0)
             self.proc = proc
-            for line in proc.stdout:
-                self.q.put(line)
+            # read whatever the pipe has (up to 64 KB) and queue its complete lines as
+            # one message; a trailing partial line waits for the next read (or EOF) so
+            # _log never splits it. Decoding/newline handling matches the old text-mode pipe
+            dec = io.IncrementalNewlineDecoder(
+                codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors="replace"), translate=True)
+            fd = proc.stdout.fileno()
+            tail = ""
+            while True:
+                chunk = os.read(fd, 65536)
+                text = tail + dec.decode(chunk, final=not chunk)
+                if not chunk:
+                    if text:
+                        self.q.put_nowait(text)
+                    break
+                cut = text.rfind("\n") + 1
+                text, tail = text[:cut], text[cut:]
+                if text:
+                    self.q.put_nowait(text)
             rc = proc.wait()
             self._last_exit_code = rc
         except Exception as e:
@@ -1569,36 +2086,45 @@ class DashboardFrame(ttk.Frame):
             self.q.put("__DONE__")
 
     def _poll_queue(self):
+        # drain what queued since the last tick (bounded so one tick can't hog the UI);
+        # _log batches the Text insert
+        done = False
         try:
-            while True:
+            for _ in range(50):
                 msg = self.q.get_nowait()
                 if msg == "__DONE__":
-                    self._finish_run(); return
+                    done = True
+                    break
                 self._log(msg)
         except queue.Empty:
-            self.after(50, self._poll_queue)
+            pass
+        if done:
+            self._finish_run(); return
+        self.after(30, self._poll_queue)
 
     def _find_shopify_import_csv(self, outdir: str):
         """
         Try to locate a Shopify CSV in outdir when 'shopify_import.csv' isn't present.
         Returns a Path or None.
         """
+        # one directory pass: exact name wins, else the newest file of the best-ranked
+        # pattern (shopify_import*.csv, then Shopify Product Import*.csv, then *shopify*.csv)
+        best = {}  # rank -> (mtime, path)
         try:
-            d = Path(outdir)
-            if not d.exists():
-                return None
-            # 1) Exact expected name
-            p = d / "shopify_import.csv"
-            if p.exists():
-                return p
-            # 2) Any file that looks like the raw/exported CSV
-            for pat in ["shopify_import*.csv", "Shopify Product Import*.csv", "*shopify*.csv"]:
-                matches = sorted(d.glob(pat), key=lambda x: x.stat().st_mtime, reverse=True)
-                if matches:
-                    return matches[0]
+            with os.scandir(outdir) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    if name == "shopify_import.csv":
+                        return Path(entry.path)
+                    if not name.endswith(".csv") or "shopify" not in name or not entry.is_file():
+                        continue
+                    rank = 0 if name.startswith("shopify_import") else 1 if name.startswith("shopify product import") else 2
+                    mt = entry.stat().st_mtime
+                    if rank not in best or mt > best[rank][0]:
+                        best[rank] = (mt, entry.path)
         except Exception:
-            pass
-        return None
+            return None
+        return Path(best[min(best)][1]) if best else None
 
     def _finish_run(self):
         self.prog.stop()
@@ -1626,16 +2152,13 @@ class DashboardFrame(ttk.Frame):
 
                 # Apply status with special case for broken images (Error 101)
                 if codes.issubset({"101"}) and self.proceed_despite_errors.get() and broken_titles:
-                    self._apply_status_with_broken_images(self._current_outdir, chosen_status, broken_titles)
+                    self._postprocess_csv(self._current_outdir, chosen_status, broken_titles)
                     self._log(
                         f"\nApplied Status='{chosen_status}' to all, but set products with broken images to 'draft' "
                         f"({len(broken_titles)} title(s))."
                     )
                 else:
-                    # Make sure we operate on the file we actually found
-                    # If your _force_status_in_csv only accepts a folder, leave as-is;
-                    # otherwise you can adapt it to accept a path.
-                    self._force_status_in_csv(self._current_outdir, chosen_status)
+                    self._postprocess_csv(self._current_outdir, chosen_status)
                     self._log(f"\nApplied Status='{chosen_status}' to {found_csv.name}")
 
                 # Rename the file we actually found
@@ -1665,53 +2188,67 @@ class DashboardFrame(ttk.Frame):
 
     def _rename_shopify_import(self, outdir: str, label: str):
         from datetime import datetime
-        import random
+        import uuid
 
         src = Path(outdir) / "shopify_import.csv"
-        if not src.exists():
-            return None
-
         date_str = datetime.now().strftime("%d-%m-%Y")
-        label_clean = sanitize_filename_part(label) or "Batch"
-        for _ in range(20):
-            rnd = random.randint(10000, 99999)
-            dst = Path(outdir) / f"Shopify Product Import - {date_str} - {label_clean} - {rnd}.csv"
-            if not dst.exists():
-                try:
-                    src.rename(dst)
-                    return str(dst)
-                except Exception:
-                    continue
-        return None
-
-    def _force_status_in_csv(self, outdir: str, status_value: str):
-        if pd is None: raise RuntimeError("pandas required to edit output CSV (pip install pandas)")
-        if status_value not in {"active","draft"}: return
-        out_csv = Path(outdir) / "shopify_import.csv"
-        if not out_csv.exists(): raise FileNotFoundError(out_csv)
-        df = pd.read_csv(out_csv, dtype=str).fillna("")
-        if "Status" not in df.columns: df["Status"] = status_value
-        else: df["Status"] = status_value
-        df.to_csv(out_csv, index=False, encoding="utf-8-sig")
-
-    def _apply_status_with_broken_images(self, outdir: str, chosen_status: str, broken_titles_set):
+        label_clean = label or "Batch"  # caller passes the already-sanitised _run_custom_label
+        # random suffix makes a clash practically impossible, so one atomic replace is enough
+        dst = Path(outdir) / f"Shopify Product Import - {date_str} - {label_clean} - {uuid.uuid4().hex[:8]}.csv"
+        try:
+            os.replace(src, dst)
+        except OSError:
+            return None
+        self._df_cache.clear()
+        return str(dst)
+
+    @staticmethod
+    def _csv_key(path: Path):
+        st = path.stat()
+        return (str(path), st.st_mtime_ns, st.st_size)
+
+    def _cached_read_csv(self, path: Path):
+        """Parsed output CSV, reused while the file is unchanged; callers get a copy."""
+        key = self._csv_key(path)
+        df = self._df_cache.get(key)
+        if df is None:
+            # this is the file users upload: read it exactly as written (no numeric
+            # inference, so '10.00' / '0123' / blank cells survive the round trip)
+            df = pd.read_csv(path, dtype=str).fillna("")
+            self._df_cache.clear()
+            self._df_cache[key] = df
+        return df.copy()
+
+    def _write_csv_cached(self, df, path: Path):
+        _write_csv_bom(df, path)
+        # what we just wrote is what the next read would parse
+        self._df_cache.clear()
+        self._df_cache[self._csv_key(path)] = df
+
+    def _postprocess_csv(self, outdir: str, status: str, broken_titles=None):
+        """
+        One read-modify-write of shopify_import.csv: set Status on every row and,
+        when broken_titles is given, flip every row of those products to 'draft'.
+        """
         if pd is None: raise RuntimeError("pandas required to edit output CSV (pip install pandas)")
+        broken_norm = {str(t).strip().lower() for t in (broken_titles or []) if str(t).strip()}
+        if status not in {"active","draft"}:
+            if not broken_norm:
+                return  # nothing to force
+            status = "active"
         out_csv = Path(outdir) / "shopify_import.csv"
         if not out_csv.exists(): raise FileNotFoundError(out_csv)
 
-        df = pd.read_csv(out_csv, dtype=str).fillna("")
-        df["Status"] = chosen_status if chosen_status in {"active","draft"} else "active"
-
-        broken_norm = {str(t).strip().lower() for t in (broken_titles_set or []) if str(t).strip()}
-        if not broken_norm:
-            df.to_csv(out_csv, index=False, encoding="utf-8-sig")
-            return
-
-        title_norm = df.get("Title", pd.Series([""]*len(df))).astype(str).str.strip().str.lower()
-        handles_to_draft = set(df.loc[title_norm.isin(broken_norm), "Handle"].dropna().astype(str).tolist())
-        if handles_to_draft:
-            df.loc[df["Handle"].astype(str).isin(handles_to_draft), "Status"] = "draft"
-        df.to_csv(out_csv, index=False, encoding="utf-8-sig")
+        df = self._cached_read_csv(out_csv)
+        df["Status"] = status
+        if broken_norm and "Title" in df.columns:
+            hit = _norm_isin(df["Title"], broken_norm)
+            if hit.any() and "Handle" in df.columns:
+                # variant rows carry no Title, so draft by handle
+                handles = df["Handle"].astype(str).to_numpy(dtype=object)
+                hit = np.isin(handles, np.unique(handles[hit]))
+            df.loc[hit, "Status"] = "draft"
+        self._write_csv_cached(df, out_csv)
 
     # ----- misc -----
     def _open_change_password(self):
@@ -1736,12 +2273,11 @@ class DashboardFrame(ttk.Frame):
                 messagebox.showerror(APP_TITLE, "Fill all fields."); return
             if n != c:
                 messagebox.showerror(APP_TITLE, "New passwords do not match."); return
-            users = cfg.get("users", [])
-            for rec in users:
-                if rec.get("username")==u and rec.get("password")==p:
-                    rec["password"] = n
-                    save_config(cfg)
-                    messagebox.showinfo(APP_TITLE, "Password updated."); dlg.destroy(); return
+            rec = cfg["users_by_name"].get(u)
+            if verify_password(rec, p):
+                set_password(rec, n)
+                save_config(cfg)
+                messagebox.showinfo(APP_TITLE, "Password updated."); dlg.destroy(); return
             messagebox.showerror(APP_TITLE, "Invalid username or current password.")
 
         ttk.Button(frm, text="Save", style="Accent.TButton", command=save_pw).grid(row=4, column=1, sticky="e", padx=UI.SM, pady=(UI.MD,0))
@@ -1757,10 +2293,31 @@ class DashboardFrame(ttk.Frame):
         try: os.startfile(d)
         except Exception: messagebox.showinfo(APP_TITLE, d)
 
-    def _clear_log(self): self.txt.delete("1.0","end")
+    def _clear_log(self):
+        self._log_buf.clear()
+        self._log_lines = 0
+        self.txt.delete("1.0","end")
     def _log(self, s:str):
+        # buffered: lines are written to the Text widget in one insert per flush
         if not s.endswith("\n"): s = s + "\n"
-        self.txt.insert("end", s); self.txt.see("end")
+        self._log_buf.append(s)
+        if not self._log_pending:
+            self._log_pending = True
+            self.after(80, self._flush_log)
+    def _flush_log(self):
+        self._log_pending = False
+        if not self._log_buf:
+            return
+        text = "".join(self._log_buf)
+        self._log_buf.clear()
+        self.txt.insert("end", text)
+        # ring-buffer the widget: drop the oldest lines (counted, no widget query)
+        self._log_lines += text.count("\n")
+        excess = self._log_lines - self.MAX_LOG_LINES
+        if excess > 0:
+            self.txt.delete("1.0", f"{excess + 1}.0")
+            self._log_lines = self.MAX_LOG_LINES
+        self.txt.see("end")
 
 
 # ===== Main App (container that swaps frames) =====
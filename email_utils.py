@@ -3,13 +3,20 @@
 
 import os
 import sys
+import importlib.util
 import json
+import copy
+import hashlib
+import hmac
 import threading
 import subprocess
-import queue
 import csv
 import shutil
+import collections
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from urllib.parse import urlparse
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, simpledialog
 import math
@@ -17,23 +24,45 @@ import time
 import re
 
 # ---------- Optional deps ----------
-try:
-    import pandas as pd
-except Exception:
-    pd = None
+def _lazy_import(name):
+    """
+    Module whose body only runs on first attribute access (None if not installed).
+    Keeps pandas/requests/pyttsx3 off the login screen's startup path.
+    """
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None or spec.loader is None:
+        return None
+    spec.loader = importlib.util.LazyLoader(spec.loader)
+    mod = importlib.util.module_from_spec(spec)
+    sys.modules[name] = mod
+    spec.loader.exec_module(mod)
+    return mod
+
+pd = _lazy_import("pandas")
+
+requests = _lazy_import("requests")
 
+# Streaming XLSX reader for validation (falls back to pd.read_excel)
+openpyxl = _lazy_import("openpyxl")
+
+# Faster JSON for config.json (falls back to stdlib json)
 try:
-    import requests
+    import orjson
 except Exception:
-    requests = None
+    orjson = None
 
 # Voice (Windows SAPI via pyttsx3). If not available, app still runs silently.
+pyttsx3 = _lazy_import("pyttsx3")
+_HAS_TTS = pyttsx3 is not None
+
+# Vectorised gradient fill (optional; PIL-only path otherwise)
 try:
-    import pyttsx3
-    _HAS_TTS = True
+    import numpy as np
 except Exception:
-    pyttsx3 = None
-    _HAS_TTS = False
+    np = None
 
 # Better image scaling (optional)
 try:
@@ -155,6 +184,23 @@ def set_ttk_theme(root: tk.Tk):
               foreground=[("disabled", "#6b7280")])
 
 
+# Validation patterns, compiled once at import
+_HTML_TAG_RE = re.compile(r"<[^>]*>")
+_WS_RE = re.compile(r"\s+")
+_PUNCT_ONLY_RE = re.compile(r"[-–—•\s]+")
+_SLUG_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+_SLUG_DASHES_RE = re.compile(r"-+")
+_HANDLE_RE = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
+_URL_RE = re.compile(r"^https?://", re.I)
+_IMG_EXT_RE = re.compile(r"\.(jpg|jpeg|png|gif|webp|tiff?)($|\?)", re.I)
+# columns _worker_preflight strips once up front
+_PREFLIGHT_COLS = ("Title*", "Vendor*", "Body (HTML)", "SEO Title", "SEO Description",
+                   "Option1 Name", "Option1 Values", "Variant Price*", "Handle (optional)")
+_WIN_BAD_TABLE = str.maketrans({c: "-" for c in '<>:"/\\|?*'})
+
+def _strip(s) -> str:
+    return str(s or "").strip()
+
 def _looks_like_placeholder_body(s: str) -> bool:
     """
     Returns True if Body (HTML) looks like a placeholder:
@@ -163,11 +209,16 @@ def _looks_like_placeholder_body(s: str) -> bool:
     - real text length (after stripping HTML/entities) < 20 chars
     """
     t = str(s or "").strip().lower()
+    has_tag, has_entity = "<" in t, "&" in t
+    if len(t) < 20 and not has_tag and not has_entity:
+        return bool(t)  # cleanup can only shrink it: non-blank and already too short
     # strip HTML tags
-    t = re.sub(r"<[^>]*>", "", t)
+    if has_tag:
+        t = _HTML_TAG_RE.sub("", t)
     # normalize common entities and whitespace
-    t = t.replace("&nbsp;", " ").replace("&#160;", " ")
-    t = re.sub(r"\s+", " ", t).strip()
+    if has_entity:
+        t = t.replace("&nbsp;", " ").replace("&#160;", " ")
+    t = _WS_RE.sub(" ", t).strip()
     if not t:
         return False  # blank is handled by Error 107
     # too short after cleanup
@@ -178,7 +229,7 @@ def _looks_like_placeholder_body(s: str) -> bool:
     if any(tok in t for tok in bad_tokens):
         return True
     # just punctuation/dashes/bullets
-    if re.fullmatch(r"[-–—•\s]+", t):
+    if _PUNCT_ONLY_RE.fullmatch(t):
         return True
     return False
 
@@ -191,23 +242,49 @@ def resource_path(p: str) -> str:
         base = os.path.abspath(".")
     return os.path.join(base, p)
 
+# resolved (and mkdir'd) once per process; every config load/save goes through these
+@lru_cache(maxsize=None)
 def appdata_dir() -> Path:
     base = os.getenv("APPDATA") or os.path.expanduser("~")
     d = Path(base) / APP_DIRNAME
     d.mkdir(parents=True, exist_ok=True)
     return d
 
+@lru_cache(maxsize=None)
 def config_path() -> Path:
     return appdata_dir() / CONFIG_BASENAME
 
+@lru_cache(maxsize=None)
 def guidelines_storage_path() -> Path:
     return appdata_dir() / GUIDELINES_BASENAME
 
+def _json_loads(data: bytes):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+def _json_dumps(obj) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+# parsed config.json, keyed by the file's mtime so repeated reads skip disk + parse
+_CFG_CACHE = {"mtime": None, "data": None}
+
 def load_config() -> dict:
     p = config_path()
-    if p.exists():
+    try:
+        mtime = p.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is not None:
+        if _CFG_CACHE["mtime"] == mtime and _CFG_CACHE["data"] is not None:
+            return copy.deepcopy(_CFG_CACHE["data"])
         try:
-            return json.loads(p.read_text(encoding="utf-8"))
+            data = _json_loads(p.read_bytes())
+            _CFG_CACHE["mtime"] = mtime
+            _CFG_CACHE["data"] = data
+            return copy.deepcopy(data)
         except Exception:
             pass
     cfg = {
@@ -217,30 +294,85 @@ def load_config() -> dict:
         "remember_last_user": False,
         "last_user": ""
     }
-    try:
-        p.write_text(json.dumps(cfg, indent=2), encoding="utf-8")
-    except Exception:
-        pass
+    save_config(cfg)
     return cfg
 
 def save_config(cfg: dict):
+    p = config_path()
     try:
-        config_path().write_text(json.dumps(cfg, indent=2), encoding="utf-8")
+        p.write_bytes(_json_dumps(cfg))
+        _CFG_CACHE["mtime"] = p.stat().st_mtime_ns
+        _CFG_CACHE["data"] = copy.deepcopy(cfg)
     except Exception:
-        pass
+        _CFG_CACHE["mtime"] = _CFG_CACHE["data"] = None
+
+def hash_password(pw: str) -> dict:
+    """scrypt hash + random salt, stored in the user record instead of the plaintext password."""
+    salt = os.urandom(16)
+    h = hashlib.scrypt(pw.encode("utf-8"), salt=salt, n=2**14, r=8, p=1, dklen=32)
+    return {"salt": salt.hex(), "hash": h.hex(), "v": 1}
+
+def verify_password(rec: dict, pw: str) -> bool:
+    """Constant-time check against a hashed record (or a legacy plaintext 'password')."""
+    if not rec:
+        return False
+    if "hash" in rec:
+        try:
+            salt = bytes.fromhex(rec.get("salt", ""))
+            expected = bytes.fromhex(rec["hash"])
+        except ValueError:
+            return False
+        h = hashlib.scrypt(pw.encode("utf-8"), salt=salt, n=2**14, r=8, p=1, dklen=len(expected) or 32)
+        return hmac.compare_digest(h, expected)
+    stored = rec.get("password")
+    if stored is None:
+        return False
+    return hmac.compare_digest(str(stored).encode("utf-8"), pw.encode("utf-8"))
+
+def set_password(rec: dict, pw: str):
+    rec.pop("password", None)
+    rec.update(hash_password(pw))
 
 def blend_hex(c1: str, c2: str, t: float) -> str:
-    c1 = c1.lstrip("#"); c2 = c2.lstrip("#")
-    r1,g1,b1 = int(c1[0:2],16), int(c1[2:4],16), int(c1[4:6],16)
-    r2,g2,b2 = int(c2[0:2],16), int(c2[2:4],16), int(c2[4:6],16)
+    v1 = int(c1.lstrip("#"), 16); v2 = int(c2.lstrip("#"), 16)
+    r1,g1,b1 = (v1 >> 16) & 0xff, (v1 >> 8) & 0xff, v1 & 0xff
+    r2,g2,b2 = (v2 >> 16) & 0xff, (v2 >> 8) & 0xff, v2 & 0xff
     r = int(r1 + (r2-r1)*t); g = int(g1 + (g2-g1)*t); b = int(b1 + (b2-b1)*t)
-    return f"#{r:02x}{g:02x}{b:02x}"
+    return f"#{(r << 16) | (g << 8) | b:06x}"
+
+def _hex_rgb(c: str):
+    v = int(c.lstrip("#"), 16)
+    return np.array(((v >> 16) & 0xff, (v >> 8) & 0xff, v & 0xff), dtype=np.float64)
+
+def _shimmer_rows(h: int, phase: float):
+    """(h, 3) uint8 rows of the dashboard header shimmer: blend_hex math for every row in one numpy pass."""
+    t = (np.arange(h) / max(h - 1, 1))[:, None]
+    base = np.trunc(_hex_rgb("#020617") + (_hex_rgb("#030712") - _hex_rgb("#020617")) * t)
+    accent = np.trunc(_hex_rgb("#1f2937") + (_hex_rgb("#111827") - _hex_rgb("#1f2937")) * t)
+    f = 0.3 + 0.7 * (0.5 + 0.5 * np.sin(phase + t * 4))
+    return np.trunc(base + (accent - base) * (f * 0.35)).astype(np.uint8)
+
+# login beam colours, indexed by int(alpha * 255)
+_BRAND_BEAM_LUT = [blend_hex("#111827", UI.BRAND, i / 255) for i in range(256)]
+# dashboard header beam colours, same indexing
+_HEADER_BEAM_LUT = [blend_hex("#020617", UI.BRAND, i / 255) for i in range(256)]
+_HEADER_BEAM_RGB = None
+
+def _header_beam_rgb():
+    """_HEADER_BEAM_LUT as a (256, 3) uint8 array for the numpy header painter."""
+    global _HEADER_BEAM_RGB
+    if _HEADER_BEAM_RGB is None:
+        _HEADER_BEAM_RGB = np.array([[int(c[i:i + 2], 16) for i in (1, 3, 5)] for c in _HEADER_BEAM_LUT], dtype=np.uint8)
+    return _HEADER_BEAM_RGB
+
+# sin() over one period in 256 steps; index with int(x * _LUT_SCALE) & 255
+_SIN_LUT = [math.sin(2 * math.pi * i / 256) for i in range(256)]
+_LUT_SCALE = 256 / (2 * math.pi)
 
 def slugify_like(s: str) -> str:
-    import re
     s = str(s or "").strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "-", s)
-    s = re.sub(r"-+", "-", s).strip("-")
+    s = _SLUG_NONALNUM_RE.sub("-", s)
+    s = _SLUG_DASHES_RE.sub("-", s).strip("-")
     return s[:255]
 
 def is_valid_handle(s: str) -> bool:
@@ -249,33 +381,92 @@ def is_valid_handle(s: str) -> bool:
     no leading/trailing hyphen, no spaces, no uppercase, no symbols.
     Empty string is allowed (it's optional and can be auto-generated later).
     """
-    s = str(s or "").strip()
+    return _is_valid_handle_norm(_strip(s))
+
+# sheets repeat the same handles/URLs/prices across variants, so the
+# validators below are memoised on their already-normalised input
+@lru_cache(maxsize=8192)
+def _is_valid_handle_norm(s: str) -> bool:
+    """is_valid_handle for input that is already stripped."""
     if not s:
         return True  # optional field
-    import re
     if len(s) > 255:
         return False
     # allow segments of [a-z0-9] separated by single hyphens
-    return bool(re.match(r"^[a-z0-9]+(?:-[a-z0-9]+)*$", s))
+    return bool(_HANDLE_RE.match(s))
 
 def is_url(s: str) -> bool:
-    import re
-    return bool(re.match(r"^https?://", str(s or "").strip(), re.I))
+    return _is_url_norm(_strip(s))
+
+@lru_cache(maxsize=8192)
+def _is_url_norm(s: str) -> bool:
+    return bool(_URL_RE.match(s))
 
 def looks_like_image_url(s: str) -> bool:
-    import re
-    return bool(re.search(r"\.(jpg|jpeg|png|gif|webp|tiff?)($|\?)", str(s or "").lower()))
+    return _looks_like_image_url_norm(str(s or ""))
+
+@lru_cache(maxsize=8192)
+def _looks_like_image_url_norm(s: str) -> bool:
+    return bool(_IMG_EXT_RE.search(s))
+
+_HTTP = None
+_HTTP_LOCK = threading.Lock()
+
+def _http_session():
+    """Shared keep-alive session so image checks reuse TCP/TLS connections."""
+    global _HTTP
+    if _HTTP is None:
+        # `requests` is lazy-loaded: its first attribute access must happen on one
+        # thread only, or other threads can see the half-initialised module
+        with _HTTP_LOCK:
+            if _HTTP is None:
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                sess = requests.Session()
+                adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64,
+                                      max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+                sess.mount("https://", adapter)
+                sess.mount("http://", adapter)
+                sess.headers["User-Agent"] = f"{APP_TITLE} image-check"
+                _HTTP = sess
+    return _HTTP
+
+# per-run memo of image checks; variants of one product usually share image URLs
+_IMG_CHECK_CACHE = {}  # stripped url -> (ok, note), oldest first
+_IMG_CHECK_MAX = 20000
+_IMG_CHECK_LOCK = threading.Lock()
+
+def clear_image_check_cache():
+    with _IMG_CHECK_LOCK:
+        _IMG_CHECK_CACHE.clear()
 
 def check_image_url(url: str, timeout=8):
+    # memoised on the stripped URL so padded copies of a link share one probe
+    key = (url or "").strip()
+    cached = _IMG_CHECK_CACHE.get(key)
+    if cached is not None:
+        return cached
+    result = _probe_image_url(key, timeout)
+    with _IMG_CHECK_LOCK:
+        if len(_IMG_CHECK_CACHE) >= _IMG_CHECK_MAX:
+            _IMG_CHECK_CACHE.pop(next(iter(_IMG_CHECK_CACHE)), None)
+        _IMG_CHECK_CACHE[key] = result
+    return result
+
+def _probe_image_url(url: str, timeout=8):
     if not url or not is_url(url):
         return False, "Not a URL"
     if requests is None:
         return (looks_like_image_url(url), "requests not installed; extension check")
     try:
-        resp = requests.head(url, allow_redirects=True, timeout=timeout)
-        if resp.status_code == 405:
-            resp = requests.get(url, stream=True, timeout=timeout)
-        if resp.status_code != 200:
+        http = _http_session()
+        resp = http.head(url, headers={"Accept": "image/*"}, allow_redirects=True, timeout=(3, timeout))
+        if resp.status_code in (405, 501):
+            # HEAD not supported: ask for a single byte so the CDN doesn't stream the whole image
+            with http.get(url, headers={"Accept": "image/*", "Range": "bytes=0-0"}, stream=True,
+                          allow_redirects=True, timeout=(3, timeout)) as resp:
+                pass
+        if resp.status_code not in (200, 206):
             return False, f"HTTP {resp.status_code}"
         ctype = (resp.headers.get("Content-Type") or "").lower()
         if "image" not in ctype:
@@ -284,22 +475,78 @@ def check_image_url(url: str, timeout=8):
     except Exception as e:
         return False, f"Error: {e}"
 
+def check_image_urls(urls, max_workers=16, timeout=8, per_host=8):
+    """
+    Check many image URLs concurrently. Duplicates (after stripping) are checked once.
+    Returns {url: (ok, note)}. At most `per_host` requests hit one host at a time.
+    """
+    keys = {u: u.strip() for u in urls if u}
+    unique = list(dict.fromkeys(keys.values()))
+    if not unique:
+        return {}
+    if requests is not None:
+        _http_session()  # finish loading requests on this thread before the pool starts
+    host_sems = {}
+    sems_lock = threading.Lock()
+
+    def _one(u):
+        try:
+            host = urlparse(u).netloc.lower()
+        except ValueError:
+            host = ""
+        with sems_lock:
+            sem = host_sems.setdefault(host, threading.BoundedSemaphore(per_host))
+        with sem:
+            return u, check_image_url(u, timeout)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(unique)))) as ex:
+        by_key = dict(ex.map(_one, unique))
+    return {u: by_key[k] for u, k in keys.items()}
+
 def is_valid_positive_price_token(x: str) -> bool:
     """
     Accepts strings like 10, 10.0, 19.99 (no commas/currency).
     Must be strictly > 0.
     """
-    s = str(x or "").strip()
+    return _is_valid_price_norm(_strip(x))
+
+@lru_cache(maxsize=8192)
+def _is_valid_price_norm(s: str) -> bool:
+    """is_valid_positive_price_token for input that is already stripped."""
     if not s:
         return False
-    import re
-    if not re.match(r"^\d+(\.\d+)?$", s):  # reject commas, currency, letters, etc.
+    # digits[.digits] only: rejects commas, currency, letters, etc. without the regex engine
+    head, dot, tail = s.partition(".")
+    if not head.isdigit() or (dot and not tail.isdigit()):
         return False
     try:
         return float(s) > 0.0
-    except Exception:
+    except ValueError:
         return False
 
+_GRAD_CACHE = collections.OrderedDict()  # (w, h, top_rgb, bottom_rgb) -> PhotoImage
+_GRAD_CACHE_MAX = 4
+
+def _gradient_photo(w, h, top, bottom):
+    """PhotoImage of a top->bottom gradient; top/bottom are 8-bit RGB tuples. Small LRU."""
+    key = (w, h, top, bottom)
+    img = _GRAD_CACHE.get(key)
+    if img is not None:
+        _GRAD_CACHE.move_to_end(key)
+        return img
+    if np is not None:
+        grad = np.linspace(top, bottom, h, endpoint=False).astype(np.uint8)
+        arr = np.ascontiguousarray(np.broadcast_to(grad[:, None, :], (h, w, 3)))
+        pil = Image.fromarray(arr, "RGB")
+    else:
+        strip = Image.new("RGB", (1, h))
+        strip.putdata([tuple(int(a + (b - a) * i / h) for a, b in zip(top, bottom)) for i in range(h)])
+        pil = strip.resize((w, h), Image.NEAREST)
+    img = _GRAD_CACHE[key] = ImageTk.PhotoImage(pil)
+    if len(_GRAD_CACHE) > _GRAD_CACHE_MAX:
+        _GRAD_CACHE.popitem(last=False)
+    return img
+
 def draw_vertical_gradient(canvas: tk.Canvas, color_top="#000000", color_bottom="#000000"):
     canvas.delete("grad")
     w = canvas.winfo_width()
@@ -308,57 +555,124 @@ def draw_vertical_gradient(canvas: tk.Canvas, color_top="#000000", color_bottom=
         return
     r1, g1, b1 = canvas.winfo_rgb(color_top)
     r2, g2, b2 = canvas.winfo_rgb(color_bottom)
+
+    if _HAS_PIL:
+        # one image item instead of h line items
+        top, bottom = (r1 >> 8, g1 >> 8, b1 >> 8), (r2 >> 8, g2 >> 8, b2 >> 8)
+        canvas._grad_img = _gradient_photo(w, h, top, bottom)  # keep a ref past LRU eviction
+        canvas.create_image(0, 0, anchor="nw", image=canvas._grad_img, tags=("grad",))
+        return
+
     r_ratio = (r2 - r1) / max(h, 1)
     g_ratio = (g2 - g1) / max(h, 1)
     b_ratio = (b2 - b1) / max(h, 1)
+    # Tk-only: fill one PhotoImage row by row instead of h line items
+    img = tk.PhotoImage(width=w, height=h)
     for i in range(h):
         nr = int(r1 + (r_ratio * i))
         ng = int(g1 + (g_ratio * i))
         nb = int(b1 + (b_ratio * i))
-        color = f"#{nr>>8:02x}{ng>>8:02x}{nb>>8:02x}"
-        canvas.create_line(0, i, w, i, fill=color, tags=("grad",))
+        img.put(f"#{nr>>8:02x}{ng>>8:02x}{nb>>8:02x}", to=(0, i, w, i + 1))
+    canvas._grad_img = img
+    canvas.create_image(0, 0, anchor="nw", image=img, tags=("grad",))
 
 # ============ SKU helpers for validation ============
 
-STRICT_SKU_RE = None
-def _sku_regex():
-    global STRICT_SKU_RE
-    import re
-    if STRICT_SKU_RE is None:
-        STRICT_SKU_RE = re.compile(r"^(?P<base>\d{6})(?:-(?P<idx>\d{2}))?$")
-    return STRICT_SKU_RE
+STRICT_SKU_RE = re.compile(r"^(?P<base>\d{6})(?:-(?P<idx>\d{2}))?$")
+_STRICT_SKU_MATCH = STRICT_SKU_RE.match
 
 def extract_base_6(s: str):
-    m = _sku_regex().match(str(s or "").strip())
-    if not m:
+    # str cells (the common case) skip the str()/or coercion
+    m = _STRICT_SKU_MATCH(s.strip() if isinstance(s, str) else str(s or "").strip())
+    return int(m.group(1)) if m else None
+
+def _read_excel_fast(path, **kw):
+    """pd.read_excel on the calamine engine when python-calamine is installed."""
+    try:
+        return pd.read_excel(path, engine="calamine", **kw)
+    except (ImportError, ValueError):
+        return pd.read_excel(path, **kw)
+
+def _read_prev_sku_column(prev_path: Path):
+    """Read just 'Variant SKU' from a previous export; None if the column isn't there."""
+    if prev_path.suffix.lower() in {".xlsx", ".xls"}:
+        head = _read_excel_fast(prev_path, dtype=str, nrows=0)
+        if "Variant SKU" not in head.columns:
+            return None
+        return _read_excel_fast(prev_path, dtype=str, usecols=[list(head.columns).index("Variant SKU")])
+    head = pd.read_csv(prev_path, dtype=str, nrows=0)
+    if "Variant SKU" not in head.columns:
+        return None
+    return pd.read_csv(prev_path, dtype=str, usecols=["Variant SKU"])
+
+def _xl_cell_str(v):
+    """Cell value as read_excel(dtype=str) would give it; None stays None."""
+    if v is None:
         return None
-    return int(m.group("base"))
+    if isinstance(v, float) and v.is_integer():
+        v = int(v)
+    return str(v)
+
+def _read_products_sheet(path, sheet=None, usecols=None):
+    """
+    Read a sheet as all-string columns (None for empty cells) using openpyxl's
+    read-only row stream. sheet=None means the first sheet; usecols keeps only
+    the named columns that exist (row count is unaffected). .xls, or a missing
+    openpyxl, goes through pd.read_excel.
+    """
+    path = Path(path)
+    if openpyxl is None or path.suffix.lower() == ".xls":
+        df = pd.read_excel(path, sheet_name=sheet if sheet is not None else 0, dtype=str)
+        return df if usecols is None else df[[c for c in df.columns if c in usecols]]
+    wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = wb[sheet] if sheet is not None else wb.worksheets[0]
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows, None) or ()
+        headers, seen = [], {}
+        for i, h in enumerate(header):
+            h = f"Unnamed: {i}" if h is None else str(h)
+            if h in seen:  # mangle duplicates like pandas does (X, X.1, ...)
+                seen[h] += 1
+                h = f"{h}.{seen[h]}"
+            else:
+                seen[h] = 0
+            headers.append(h)
+        keep = [(j, h) for j, h in enumerate(headers) if usecols is None or h in usecols]
+        cols = [[] for _ in keep]
+        nrows = 0
+        for row in rows:
+            if not any(v is not None for v in row):
+                continue  # read_excel skips blank rows
+            nrows += 1
+            for k, (j, _) in enumerate(keep):
+                cols[k].append(_xl_cell_str(row[j]) if j < len(row) else None)
+    finally:
+        wb.close()
+    names = [h for _, h in keep]
+    return pd.DataFrame(dict(zip(names, cols)), columns=names, index=pd.RangeIndex(nrows), dtype=object)
 
 def load_prev_highest_base(prev_path: Path) -> int:
     """Used only to validate presence of a highest SKU (Error 103)."""
     if pd is None or not prev_path or not prev_path.exists():
         return 0
     try:
-        if prev_path.suffix.lower() in {".xlsx", ".xls"}:
-            pdf = pd.read_excel(prev_path, dtype=str)
-        else:
-            pdf = pd.read_csv(prev_path, dtype=str)
+        pdf = _read_prev_sku_column(prev_path)
     except Exception:
         return 0
     if pdf is None or pdf.empty:
         return 0
     pdf = pdf.fillna("")
-    if "Variant SKU" not in pdf.columns:
+    col = pdf["Variant SKU"].astype(str).str.strip()
+    filled = col[col.ne("") & col.str.lower().ne("nan")]
+    if filled.empty:
         return 0
-    col = pdf["Variant SKU"].astype(str).str.strip().tolist()
-    top_cell = next((v for v in col if v and v.lower() != "nan"), None)
-    if top_cell:
-        b = extract_base_6(top_cell)
-        if b is not None:
-            return b
-    bases = [extract_base_6(v) for v in col if v]
-    bases = [b for b in bases if b is not None]
-    return max(bases) if bases else 0
+    # one vectorised match instead of extract_base_6 per row; top filled cell wins if it parses
+    bases = pd.to_numeric(filled.str.extract(r"^(\d{6})(?:-\d{2})?$", expand=False), errors="coerce")
+    first = bases.iat[0]
+    if pd.notna(first):
+        return int(first)
+    return int(bases.max()) if bases.notna().any() else 0
 
 # ===== “How to fix” tips =====
 def build_fix_tips(active_codes):
@@ -446,15 +760,16 @@ def build_fix_tips(active_codes):
 
 def sanitize_filename_part(s: str) -> str:
     """Remove Windows-illegal filename chars and trim length."""
-    import re
-    s = str(s or "").strip()
-    s = re.sub(r'[<>:"/\\|?*]+', "-", s)
-    s = re.sub(r"\s+", " ", s)
+    s = str(s or "").strip().translate(_WIN_BAD_TABLE)
+    s = " ".join(s.split())
     return s[:80] if s else s
 
 # ============ Small helpers (UI) ============
 
 class Tooltip:
+    # one hidden tip window per Tk root, re-labelled/moved on hover instead of created and destroyed
+    _shared = {}
+
     def __init__(self, widget, text, delay=600):
         self.widget = widget
         self.text = text
@@ -467,26 +782,41 @@ class Tooltip:
     def _schedule(self, _=None):
         self.after_id = self.widget.after(self.delay, self._show)
 
+    def _tip_window(self):
+        root = self.widget._root()
+        shared = Tooltip._shared.get(root)
+        if shared is None or not shared[0].winfo_exists():
+            win = tk.Toplevel(root)
+            win.withdraw()
+            win.overrideredirect(True)
+            win.attributes("-topmost", True)
+            lbl = tk.Label(win, bg="#020617", fg="#f9fafb",
+                           padx=8, pady=6, font=("Segoe UI", 9))
+            lbl.pack()
+            shared = Tooltip._shared[root] = (win, lbl)
+        return shared
+
     def _show(self):
+        self.after_id = None
         if self.tip:
             return
-        x, y, cx, cy = self.widget.bbox("insert") if self.widget.winfo_ismapped() else (0,0,0,0)
-        x += self.widget.winfo_rootx() + 20
-        y += self.widget.winfo_rooty() + 20
-        self.tip = tk.Toplevel(self.widget)
-        self.tip.overrideredirect(True)
-        self.tip.attributes("-topmost", True)
-        lbl = tk.Label(self.tip, text=self.text, bg="#020617", fg="#f9fafb",
-                       padx=8, pady=6, font=("Segoe UI", 9))
-        lbl.pack()
-        self.tip.geometry(f"+{x}+{y}")
+        win, lbl = self._tip_window()
+        lbl.config(text=self.text)
+        x = self.widget.winfo_rootx() + 20
+        y = self.widget.winfo_rooty() + 20
+        win.geometry(f"+{x}+{y}")
+        win.deiconify()
+        win.lift()
+        self.tip = win
 
     def _hide(self, _=None):
         if self.after_id:
             try: self.widget.after_cancel(self.after_id)
             except Exception: pass
+            self.after_id = None
         if self.tip:
-            self.tip.destroy()
+            try: self.tip.withdraw()
+            except tk.TclError: pass
             self.tip = None
 
 # ============ App Frames ============
@@ -540,68 +870,93 @@ class LoginFrame(ttk.Frame):
         left = tk.Canvas(card, highlightthickness=0, bd=0, bg="#020617")
         left.grid(row=0, column=0, sticky="nsew")
 
-        self._left_logo_img = None
         self._logo_float_phase = 0.0
+        self._logo_dy = 0
+        self._beam_ids = []
+        self._beam_bucket = None
+        self._beam_cache = {}  # phase bucket -> beam colours for the current width
+        BEAM_STEPS = 64  # phase buckets per sin() period
+
+        def _load_logo():
+            logo_path = resource_path("amsons.png")
+            if not os.path.exists(logo_path):
+                return None
+            try:
+                if _HAS_PIL:
+                    img0 = Image.open(logo_path).convert("RGBA")
+                    max_w, max_h = 220, 80
+                    W, H = img0.size
+                    scale = min(max_w / float(W), max_h / float(H), 1.0)
+                    img0 = img0.resize((int(W * scale), int(H * scale)), Image.LANCZOS)
+                    return ImageTk.PhotoImage(img0)
+                return tk.PhotoImage(file=logo_path)
+            except Exception:
+                return None
 
-        def _draw_left(_evt=None):
+        # decoded once, not per animation frame
+        self._left_logo_img = _load_logo()
+
+        def _beam_colors(w, bucket):
+            cols = self._beam_cache.get(bucket)
+            if cols is None:
+                phase = bucket * (2 * math.pi / BEAM_STEPS)
+                # alpha = 0.15 + 0.35*sin(...) can dip below 0; the LUT index is clamped
+                cols = self._beam_cache[bucket] = [
+                    _BRAND_BEAM_LUT[int(max(0.0, min(1.0, 0.15 + 0.35 * math.sin(phase + (i / max(w - 1, 1)) * 4))) * 255)]
+                    for i in range(0, w, 4)
+                ]
+            return cols
+
+        def _rebuild_static(_evt=None):
+            # full redraw: only on <Configure>
             left.delete("all")
             w, h = max(1, left.winfo_width()), max(1, left.winfo_height())
+            self._beam_cache.clear()
+            self._beam_bucket = None
 
-            # angled gradient
-            for i in range(h):
-                t = i / max(h - 1, 1)
-                base = blend_hex("#020617", "#111827", t)
-                left.create_line(0, i, w, i, fill=base)
+            # angled gradient (one image item with PIL)
+            draw_vertical_gradient(left, "#020617", "#111827")
 
-            # subtle gold beam
-            for i in range(0, w, 4):
-                t = i / max(w - 1, 1)
-                alpha = 0.15 + 0.35 * math.sin(self._logo_float_phase + t * 4)
-                col = blend_hex("#111827", UI.BRAND, alpha)
-                left.create_line(i, 0, i, h, fill=col)
-
-            # logo
-            logo_path = resource_path("amsons.png")
-            img_obj = None
-            if os.path.exists(logo_path):
-                try:
-                    if _HAS_PIL:
-                        img0 = Image.open(logo_path).convert("RGBA")
-                        max_w, max_h = 220, 80
-                        W, H = img0.size
-                        scale = min(max_w / float(W), max_h / float(H), 1.0)
-                        img0 = img0.resize((int(W * scale), int(H * scale)), Image.LANCZOS)
-                        img_obj = ImageTk.PhotoImage(img0)
-                    else:
-                        img_obj = tk.PhotoImage(file=logo_path)
-                except Exception:
-                    img_obj = None
+            # subtle gold beam: items made here, recoloured per tick
+            self._beam_ids = [left.create_line(i, 0, i, h) for i in range(0, w, 4)]
 
-            self._left_logo_img = img_obj
+            # logo + taglines, moved as one "float" group per tick
+            self._logo_dy = int(6 * math.sin(self._logo_float_phase))
             cx = w // 2
-            cy = int(h * 0.32) + int(6 * math.sin(self._logo_float_phase))
-
+            cy = int(h * 0.32) + self._logo_dy
             if self._left_logo_img:
-                left.create_image(cx, cy, image=self._left_logo_img, anchor="center")
-
-            # taglines
+                left.create_image(cx, cy, image=self._left_logo_img, anchor="center", tags=("float",))
             left.create_text(cx, cy + 70,
                              text="Amsons Shopify Bulk Product Import Generator",
                              fill="#f9fafb",
                              font=("Segoe UI Semibold", 13),
-                             anchor="n")
+                             anchor="n", tags=("float",))
             left.create_text(cx, cy + 100,
                              text="Design • Validate • Export\nYour product catalog, controlled.",
                              fill="#9CA3AF",
                              font=("Segoe UI", 9),
-                             anchor="n")
+                             anchor="n", tags=("float",))
+            _redraw_animated()
+
+        def _redraw_animated():
+            # per tick: recolour the beam and nudge the logo, nothing is recreated
+            w = max(1, left.winfo_width())
+            bucket = int(self._logo_float_phase / (2 * math.pi) * BEAM_STEPS) % BEAM_STEPS
+            if bucket != self._beam_bucket:
+                self._beam_bucket = bucket
+                for item, col in zip(self._beam_ids, _beam_colors(w, bucket)):
+                    left.itemconfigure(item, fill=col)
+            dy = int(6 * math.sin(self._logo_float_phase))
+            if dy != self._logo_dy:
+                left.move("float", 0, dy - self._logo_dy)
+                self._logo_dy = dy
 
         def _tick():
             self._logo_float_phase += 0.05
-            _draw_left()
+            _redraw_animated()
             self.after(60, _tick)
 
-        left.bind("<Configure>", _draw_left)
+        left.bind("<Configure>", _rebuild_static)
         self.after(200, _tick)
 
         # RIGHT: login form
@@ -713,7 +1068,7 @@ class LoginFrame(ttk.Frame):
                 messagebox.showerror(APP_TITLE, "This username already exists. Choose another.")
                 return
 
-            users.append({"username": user, "password": pw})
+            users.append({"username": user, **hash_password(pw)})
             cfg["users"] = users
             save_config(cfg)
 
@@ -735,18 +1090,15 @@ class LoginFrame(ttk.Frame):
         u = self.username.get().strip()
         p = self.password.get().strip()
 
-        ok = False
-        for rec in load_config().get("users", []):
-            if rec.get("username") == u and rec.get("password") == p:
-                ok = True
-                break
-
-        if not ok:
+        cfg = load_config()
+        rec = next((r for r in cfg.get("users", []) if r.get("username") == u), None) if u else None
+        if not verify_password(rec, p):
             messagebox.showerror(APP_TITLE, "Invalid username or password.")
             return
+        if "hash" not in rec:
+            set_password(rec, p)  # migrate legacy plaintext entry
 
         # Remember choice
-        cfg = load_config()
         cfg["remember_last_user"] = bool(self.remember.get())
         cfg["last_user"] = u if self.remember.get() else ""
         save_config(cfg)
@@ -768,6 +1120,8 @@ class LoginFrame(ttk.Frame):
 
 
 class DashboardFrame(ttk.Frame):
+    MAX_LOG_LINES = 5000  # live log keeps only the newest lines
+
     def __init__(self, master, username: str):
         super().__init__(master)
         self.master = master
@@ -786,12 +1140,25 @@ class DashboardFrame(ttk.Frame):
         self._run_custom_label = ""
 
         self.proc = None
-        self.q = queue.Queue()
+        # worker -> UI messages: single producer, single consumer, so a bare deque
+        # (atomic append/popleft) plus an Event saying "something arrived" is enough
+        self.q = collections.deque()
+        self._q_event = threading.Event()
+        self._log_buf = collections.deque(maxlen=self.MAX_LOG_LINES)  # older lines would be trimmed anyway
+        self._log_pending = False
+        self._log_lines = 0
         self.phase = "idle"
         self._last_exit_code = None
         self._current_outdir = None
 
         self._header_anim_t = 0.0
+        self._header_size = None
+        self._logo_cache = {}
+        self._grad_img_id = None
+        self._header_photo = self._hdr_frame = None
+        self._grad_rows, self._grad_cols = [], []
+        self._beam_items, self._beam_ts, self._beam_cols = [], [], []
+        self._hdr_costs = collections.deque(maxlen=10)  # seconds spent on recent shimmer frames
         self._build_ui()
 
     def _build_ui(self):
@@ -991,48 +1358,73 @@ class DashboardFrame(ttk.Frame):
         self.status_bar.pack(fill="x")
 
     # ----- header -----
+    def _load_header_logo(self, max_h=60):
+        # decoded/resized once per (file, mtime, height); later resizes reuse it
+        logo_path = resource_path("amsons.png")
+        try:
+            key = (logo_path, os.path.getmtime(logo_path), max_h)
+        except OSError:
+            return None
+        if key in self._logo_cache:
+            return self._logo_cache[key]
+        self._logo_cache.clear()
+        img = self._logo_cache[key] = self._decode_header_logo(logo_path, max_h)
+        return img
+
+    def _decode_header_logo(self, logo_path, max_h):
+        try:
+            if _HAS_PIL:
+                img0 = Image.open(logo_path).convert("RGBA")
+                W,H = img0.size
+                if H > max_h:
+                    scale = max_h/float(H)
+                    img0 = img0.resize((int(W*scale), int(H*scale)), Image.LANCZOS)
+                return ImageTk.PhotoImage(img0)
+            img = tk.PhotoImage(file=logo_path)
+            if img.height()>max_h:
+                factor = max(2, img.height()//max_h)
+                img = img.subsample(factor, factor)
+            return img
+        except Exception:
+            return None
+
     def _redraw_header(self, _evt=None):
+        # static layer: items are rebuilt only when the header size changes
         c = self.header
-        c.delete("all")
         w,h = c.winfo_width(), c.winfo_height()
+        if (w, h) == self._header_size:
+            return
+        self._header_size = (w, h)
+        c.delete("all")
 
-        # angled gradient with shimmer
-        for i in range(h):
-            t = i / max(h - 1, 1)
-            base = blend_hex("#020617", "#030712", t)
-            accent = blend_hex("#1f2937", "#111827", t)
-            f = 0.3 + 0.7 * (0.5 + 0.5 * math.sin(self._header_anim_t + t * 4))
-            col = blend_hex(base, accent, f * 0.35)
-            c.create_line(0, i, w, i, fill=col)
-
-        # soft diagonal gold beam
-        for x in range(0, w, 5):
-            t = x / max(w - 1, 1)
-            alpha = 0.08 + 0.28 * max(0, math.cos(self._header_anim_t + t * 5))
-            beam = blend_hex("#020617", UI.BRAND, alpha)
-            c.create_line(x, 0, x + 60, h, fill=beam)
+        # angled gradient with shimmer: one image item, repainted per frame by _shimmer_header
+        self._grad_img_id = c.create_image(0, 0, anchor="nw")
+        self._grad_rows, self._beam_items, self._beam_ts = [], [], []
+        if _HAS_PIL and np is not None and w > 0 and h > 0:
+            # the diagonal beams are rasterised into the same frame buffer
+            self._header_photo = ImageTk.PhotoImage("RGB", (w, h))
+            self._hdr_frame = np.empty((h, w, 3), dtype=np.uint8)
+            xs = np.arange(0, w, 5)
+            ys = np.arange(h)[:, None]
+            bx = xs[None, :] + (60 * ys) // max(h, 1)  # line (x, 0) -> (x + 60, h)
+            on = bx < w
+            self._beam_px = (np.broadcast_to(ys, bx.shape)[on], bx[on],
+                             np.broadcast_to(np.arange(xs.size), bx.shape)[on])
+            self._beam_t_arr = xs / max(w - 1, 1)
+        else:
+            self._header_photo, self._hdr_frame = tk.PhotoImage(width=max(w, 1), height=max(h, 1)), None
+            for i in range(h):
+                t = i / max(h - 1, 1)
+                self._grad_rows.append((blend_hex("#020617", "#030712", t), blend_hex("#1f2937", "#111827", t)))
+            # soft diagonal gold beam
+            self._beam_ts = [x / max(w - 1, 1) for x in range(0, w, 5)]
+            self._beam_items = [c.create_line(x, 0, x + 60, h) for x in range(0, w, 5)]
+        c.itemconfigure(self._grad_img_id, image=self._header_photo)
+        self._grad_cols = [None] * len(self._grad_rows)
+        self._beam_cols = [None] * len(self._beam_items)
 
         # logo & text
-        logo_path = resource_path("amsons.png")
-        img = None
-        if os.path.exists(logo_path):
-            try:
-                if _HAS_PIL:
-                    img0 = Image.open(logo_path).convert("RGBA")
-                    max_h = 60
-                    W,H = img0.size
-                    if H > max_h:
-                        scale = max_h/float(H)
-                        img0 = img0.resize((int(W*scale), int(H*scale)), Image.LANCZOS)
-                    img = ImageTk.PhotoImage(img0)
-                else:
-                    img = tk.PhotoImage(file=logo_path)
-                    if img.height()>60:
-                        factor = max(2, img.height()//60)
-                        img = img.subsample(factor, factor)
-            except Exception:
-                img = None
-        self.logo_img = img
+        self.logo_img = self._load_header_logo()
 
         padding_x = 40
         y_center = int(h * 0.5)
@@ -1054,11 +1446,46 @@ class DashboardFrame(ttk.Frame):
                       font=("Segoe UI", 9),
                       anchor="w")
 
+        self._shimmer_header()
+
+    def _shimmer_header(self):
+        # per frame: repaint the header image in place and recolour the beam items, nothing is recreated
+        c = self.header
+        w, h = self._header_size
+        if self._hdr_frame is None:  # Tk-only painter
+            p = self._header_anim_t * _LUT_SCALE
+            for i, (base, accent) in enumerate(self._grad_rows):
+                t = i / max(h - 1, 1)
+                f = 0.3 + 0.7 * (0.5 + 0.5 * _SIN_LUT[int(p + t * 4 * _LUT_SCALE) & 255])
+                col = blend_hex(base, accent, f * 0.35)
+                if col != self._grad_cols[i]:
+                    self._grad_cols[i] = col
+                    self._header_photo.put(col, to=(0, i, w, i + 1))
+            for i, (item, t) in enumerate(zip(self._beam_items, self._beam_ts)):
+                cos = _SIN_LUT[(int(p + t * 5 * _LUT_SCALE) + 64) & 255]  # cos(x) == sin(x + pi/2)
+                col = _HEADER_BEAM_LUT[int((0.08 + 0.28 * max(0.0, cos)) * 255)]
+                if col != self._beam_cols[i]:
+                    self._beam_cols[i] = col
+                    c.itemconfigure(item, fill=col)
+            return
+        frame = self._hdr_frame
+        frame[:] = _shimmer_rows(h, self._header_anim_t)[:, None, :]
+        alpha = 0.08 + 0.28 * np.maximum(0.0, np.cos(self._header_anim_t + self._beam_t_arr * 5))
+        beam = _header_beam_rgb()[(alpha * 255).astype(np.intp)]
+        ys, xs, k = self._beam_px
+        frame[ys, xs] = beam[k]
+        self._header_photo.paste(Image.fromarray(frame, "RGB"))
+
     def _animate_header(self):
-        # gentle shimmer
+        # gentle shimmer, paced by how long recent frames took
         self._header_anim_t += 0.04
-        self._redraw_header()
-        self.after(60, self._animate_header)
+        if self._header_size is not None:
+            t0 = time.perf_counter()
+            self._shimmer_header()
+            self._hdr_costs.append(time.perf_counter() - t0)
+        avg = sum(self._hdr_costs) / len(self._hdr_costs) if self._hdr_costs else 0.0
+        # keep shimmer work to ~25% of the main loop so validation polling never starves
+        self.after(max(60, min(500, int(avg * 4000))), self._animate_header)
 
     # ----- pickers -----
     def _pick_script(self):
@@ -1153,28 +1580,25 @@ class DashboardFrame(ttk.Frame):
             "Image URL 1": "https://dummyimage.com/800x800/333/fff.jpg&text=T-Shirt",
         }
 
+        template = dict.fromkeys(columns, "")
         def normalize(row):
-            return {c: row.get(c, "") for c in columns}
+            # template gives column order and blank defaults; keys outside `columns` stay dropped
+            r = template.copy()
+            r.update((c, row[c]) for c in template.keys() & row.keys())
+            return r
         return [normalize(simple), normalize(variant)]
 
     def _save_template_csv(self, path: str, columns, rows):
         Path(path).parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        with open(path, "w", newline="", encoding="utf-8-sig", buffering=1 << 20) as f:
             writer = csv.DictWriter(f, fieldnames=columns)
             writer.writeheader()
-            for r in rows:
-                writer.writerow(r)
+            writer.writerows(rows)
 
     def _save_template_excel(self, path: str, columns, rows, sheet_name: str):
         if pd is None:
             raise RuntimeError("pandas is required to write XLSX. Choose CSV or install: pip install pandas openpyxl")
-        import importlib
-        engine = None
-        try:
-            importlib.import_module("openpyxl")
-            engine = "openpyxl"
-        except Exception:
-            engine = None
+        engine = "openpyxl" if openpyxl is not None else None
         df = pd.DataFrame(rows, columns=columns)
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         with pd.ExcelWriter(path, engine=engine) as xw:
@@ -1300,16 +1724,20 @@ class DashboardFrame(ttk.Frame):
     def _worker_preflight(self, inp_path: str, sheet: str, prev_path_str: str):
         try:
             try:
-                df = pd.read_excel(inp_path, sheet_name=sheet, dtype=str)
+                df = _read_products_sheet(inp_path, sheet)
             except Exception as e:
-                self.q.put(("__VALIDATION_FAIL__", {
+                self._post(("__VALIDATION_FAIL__", {
                     "detail": f"Error 104: Blank/Unreadable Import Sheet\nCannot read sheet '{sheet}' in '{inp_path}'.\n\n{e}",
                     "codes": ["104"],
                     "broken_titles": []
                 }))
                 return
             df = df.fillna("")
-            total = int(df["Title*"].astype(str).str.strip().ne("").sum()) if "Title*" in df.columns else 0
+            # stripped text / non-blank mask of every column the checks read, built once and shared
+            S = {c: df[c].astype(str).str.strip() for c in _PREFLIGHT_COLS if c in df.columns}
+            NE = {c: col.ne("") for c, col in S.items()}
+            blank = pd.Series("", index=df.index, dtype=object)
+            total = int(NE["Title*"].sum()) if "Title*" in NE else 0
 
             codes = set()
             sections = []
@@ -1327,9 +1755,9 @@ class DashboardFrame(ttk.Frame):
                 missing_cols = [c for c in ["Title*","Vendor*","Variant Price*"] if c not in df.columns]
                 miss_msgs.append(f"- Missing required column(s): {', '.join(missing_cols)}")
             else:
-                miss_t = df.index[df["Title*"].astype(str).str.strip() == ""].tolist()
-                miss_v = df.index[df["Vendor*"].astype(str).str.strip() == ""].tolist()
-                miss_p = df.index[df["Variant Price*"].astype(str).str.strip() == ""].tolist()
+                miss_t = df.index[~NE["Title*"]].tolist()
+                miss_v = df.index[~NE["Vendor*"]].tolist()
+                miss_p = df.index[~NE["Variant Price*"]].tolist()
                 if miss_t: miss_msgs.append(f"- Missing Title* on rows: {', '.join(str(i+2) for i in miss_t)}")
                 if miss_v: miss_msgs.append(f"- Missing Vendor* on rows: {', '.join(str(i+2) for i in miss_v)}")
                 if miss_p: miss_msgs.append(f"- Missing Variant Price* on rows: {', '.join(str(i+2) for i in miss_p)}")
@@ -1340,80 +1768,64 @@ class DashboardFrame(ttk.Frame):
 
             # Error 110: Variant Options Mismatch (Option1 Name/Values must be paired)
             if "Option1 Name" in df.columns or "Option1 Values" in df.columns:
-                name_series = df.get("Option1 Name", pd.Series([""] * len(df))).astype(str).str.strip()
-                vals_series = df.get("Option1 Values", pd.Series([""] * len(df))).astype(str).str.strip()
+                name_series = S.get("Option1 Name", blank)
+                vals_series = S.get("Option1 Values", blank)
 
-                mism_idxs = []
-                for i in range(len(df)):
-                    has_name = bool(name_series.iat[i])
-                    has_vals = bool(vals_series.iat[i])
-                    # flag if exactly one is present
-                    if has_name ^ has_vals:
-                        mism_idxs.append(i)
+                # flag if exactly one is present
+                mism_idxs = df.index[name_series.ne("") ^ vals_series.ne("")].tolist()
 
                 if mism_idxs:
                     codes.add("110")
-                    lines = []
-                    for i in mism_idxs[:60]:  # cap lines for dialog length
-                        rowno = i + 2
-                        title = df.at[i, "Title*"] if "Title*" in df.columns else ""
-                        n = name_series.iat[i]
-                        v = vals_series.iat[i]
-                        lines.append(f"- Row {rowno}: Title='{title}'  Option1 Name='{n}'  Option1 Values='{v}'")
+                    shown = mism_idxs[:60]  # cap lines for dialog length
+                    titles = df.loc[shown, "Title*"] if "Title*" in df.columns else pd.Series("", index=shown)
+                    lines = [f"- Row {i + 2}: Title='{title}'  Option1 Name='{n}'  Option1 Values='{v}'"
+                             for i, title, n, v in zip(shown, titles, name_series.loc[shown], vals_series.loc[shown])]
                     more = f"\n  ... and {len(mism_idxs) - 60} more row(s)" if len(mism_idxs) > 60 else ""
                     sections.append("Error 110: Variant Options Mismatch (Option1)\n" + "\n".join(lines) + more)
 
             # Error 108: invalid price tokens (non-numeric, zero, or negative)
             if "Variant Price*" in df.columns:
-                invalid_idxs = []
-                col = df["Variant Price*"].astype(str)
-                for i, val in col.items():
-                    s = str(val).strip()
-                    # Skip blanks here (already handled by Error 105 missing mandatory)
-                    if not s:
-                        continue
-                    if not is_valid_positive_price_token(s):
-                        invalid_idxs.append(i)
+                price = S["Variant Price*"]
+                # same grammar as is_valid_positive_price_token, checked for the whole column at once
+                valid_fmt = price.str.fullmatch(r"\d+(?:\.\d+)?")
+                num = pd.to_numeric(price.where(valid_fmt, ""), errors="coerce")
+                # Skip blanks here (already handled by Error 105 missing mandatory)
+                invalid_mask = price.ne("") & ~(valid_fmt & num.gt(0))
+                invalid_idxs = df.index[invalid_mask].tolist()
 
                 if invalid_idxs:
                     codes.add("108")
-                    lines = []
-                    for i in invalid_idxs[:60]:  # show first 60 rows to keep dialog small
-                        title = df.at[i, "Title*"] if "Title*" in df.columns else ""
-                        lines.append(f"- Row {i + 2}: {title} — price='{str(df.at[i, 'Variant Price*']).strip()}'")
+                    shown = invalid_idxs[:60]  # show first 60 rows to keep dialog small
+                    titles = df.loc[shown, "Title*"] if "Title*" in df.columns else pd.Series("", index=shown)
+                    lines = [f"- Row {i + 2}: {title} — price='{p}'"
+                             for i, title, p in zip(shown, titles, price.loc[shown])]
                     more = f"\n  ... and {len(invalid_idxs) - 60} more row(s)" if len(invalid_idxs) > 60 else ""
                     sections.append("Error 108: Invalid Price\n" + "\n".join(lines) + more)
 
             # Error 106: missing SEO Title/Description on any row
             present_seo_cols = [c for c in ["SEO Title", "SEO Description"] if c in df.columns]
             if present_seo_cols:
-                cond = False
-                for c in present_seo_cols:
-                    series = df[c].astype(str).str.strip()
-                    cond = series.eq("") if cond is False else (cond | series.eq(""))
-                if cond is not False:
-                    idxs = list(df.index[cond])
-                    if idxs:
-                        codes.add("106")
-                        lines = []
-                        for i in idxs[:40]:
-                            title = df.at[i, "Title*"] if "Title*" in df.columns else ""
-                            rowno = i + 2
-                            lines.append(f"- Row {rowno}: {title}")
-                        more = f"\n  ... and {len(idxs)-40} more row(s)" if len(idxs) > 40 else ""
-                        sections.append("Error 106: Missing SEO Title/Description on rows\n" + "\n".join(lines) + more)
+                # OR the per-column blank masks in place on plain numpy bool arrays
+                cond = (~NE[present_seo_cols[0]]).to_numpy(dtype=bool, copy=True)
+                for c in present_seo_cols[1:]:
+                    np.logical_or(cond, (~NE[c]).to_numpy(dtype=bool), out=cond)
+                idxs = df.index[cond].tolist()
+                if idxs:
+                    codes.add("106")
+                    lines = []
+                    for i in idxs[:40]:
+                        title = df.at[i, "Title*"] if "Title*" in df.columns else ""
+                        rowno = i + 2
+                        lines.append(f"- Row {rowno}: {title}")
+                    more = f"\n  ... and {len(idxs)-40} more row(s)" if len(idxs) > 40 else ""
+                    sections.append("Error 106: Missing SEO Title/Description on rows\n" + "\n".join(lines) + more)
 
                 # Error 111: SEO Length Limits (Title > ~60 or Description > ~320)
                 if "SEO Title" in df.columns or "SEO Description" in df.columns:
-                    st = df.get("SEO Title", pd.Series([""] * len(df))).astype(str)
-                    sd = df.get("SEO Description", pd.Series([""] * len(df))).astype(str)
-
-                    over_idxs = []
-                    for i in range(len(df)):
-                        title_len = len(st.iat[i].strip())
-                        desc_len = len(sd.iat[i].strip())
-                        if (title_len > 60) or (desc_len > 320):
-                            over_idxs.append((i, title_len, desc_len))
+                    st_len = S.get("SEO Title", blank).str.len()
+                    sd_len = S.get("SEO Description", blank).str.len()
+                    over = df.index[st_len.gt(60) | sd_len.gt(320)]
+                    over_idxs = list(zip(over, st_len.loc[over], sd_len.loc[over]))
 
                     if over_idxs:
                         codes.add("111")
@@ -1429,8 +1841,8 @@ class DashboardFrame(ttk.Frame):
 
             # Error 107: Title* present but Body (HTML) blank
             if "Title*" in df.columns and "Body (HTML)" in df.columns:
-                title_nonempty = df["Title*"].astype(str).str.strip().ne("")
-                body_blank = df["Body (HTML)"].astype(str).str.strip().eq("")
+                title_nonempty = NE["Title*"]
+                body_blank = ~NE["Body (HTML)"]
                 idxs = list(df.index[title_nonempty & body_blank])
                 if idxs:
                     codes.add("107")
@@ -1444,7 +1856,7 @@ class DashboardFrame(ttk.Frame):
             # Error 102: duplicate titles inside template
             dup_inside = []
             if "Title*" in df.columns:
-                tnorm = df["Title*"].astype(str).str.strip().str.lower()
+                tnorm = S["Title*"].str.lower()
                 vc = tnorm.value_counts()
                 dups = vc[vc > 1]
                 if not dups.empty:
@@ -1508,9 +1920,7 @@ class DashboardFrame(ttk.Frame):
             # Error 109: bad handle format
             if "Handle (optional)" in df.columns:
                 bad_idxs = []
-                col = df["Handle (optional)"].astype(str)
-                for i, val in col.items():
-                    s = str(val).strip()
+                for i, s in S["Handle (optional)"].items():
                     if not s:
                         continue  # optional; blank is fine
                     if not is_valid_handle(s):
@@ -1521,7 +1931,7 @@ class DashboardFrame(ttk.Frame):
                     lines = []
                     for i in bad_idxs[:60]:  # cap to avoid huge dialog
                         title = df.at[i, "Title*"] if "Title*" in df.columns else ""
-                        bad = str(df.at[i, "Handle (optional)"]).strip()
+                        bad = S["Handle (optional)"].at[i]
                         lines.append(f"- Row {i + 2}: {title} — handle='{bad}'")
                     more = f"\n  ... and {len(bad_idxs) - 60} more row(s)" if len(bad_idxs) > 60 else ""
                     sections.append("Error 109: Bad Handle Format\n" + "\n".join(lines) + more)
@@ -1533,17 +1943,19 @@ class DashboardFrame(ttk.Frame):
             else:
                 titles_series = pd.Series([""]*len(df))
 
-            for n in range(1,9):
-                col = f"Image URL {n}"
-                if col in df.columns:
-                    for idx,url in df[col].astype(str).items():
-                        if url.strip():
-                            title = titles_series.iloc[idx] if idx < len(titles_series) else ""
-                            ok, note = check_image_url(url)
-                            if not ok:
-                                broken_lines.append(f"- [{n}] {title} => {url} ({note})")
-                                if title.strip():
-                                    broken_titles_set.add(title.strip())
+            img_cols = [(n, f"Image URL {n}") for n in range(1,9) if f"Image URL {n}" in df.columns]
+            # probe every distinct URL up front, concurrently, then report in sheet order
+            clear_image_check_cache()
+            results = check_image_urls([u for _, col in img_cols for u in df[col].astype(str) if u.strip()])
+            for n, col in img_cols:
+                for idx,url in df[col].astype(str).items():
+                    if url.strip():
+                        title = titles_series.iloc[idx] if idx < len(titles_series) else ""
+                        ok, note = results[url]
+                        if not ok:
+                            broken_lines.append(f"- [{n}] {title} => {url} ({note})")
+                            if title.strip():
+                                broken_titles_set.add(title.strip())
 
             if broken_lines:
                 codes.add("101")
@@ -1574,25 +1986,31 @@ class DashboardFrame(ttk.Frame):
             if codes:
                 header = [f"Products found (non-empty Title*): {total}"]
                 detail = "\n\n".join(header + sections)
-                self.q.put(("__VALIDATION_FAIL__", {
+                self._post(("__VALIDATION_FAIL__", {
                     "detail": detail,
                     "codes": list(codes),
                     "broken_titles": sorted(broken_titles_set)
                 }))
                 return
 
-            self.q.put(("__VALIDATION_OK__", {"detail": f"Validation passed.\nProducts found: {total}"}))
+            self._post(("__VALIDATION_OK__", {"detail": f"Validation passed.\nProducts found: {total}"}))
         except Exception as e:
-            self.q.put(("__VALIDATION_FAIL__", {
+            self._post(("__VALIDATION_FAIL__", {
                 "detail": f"Unexpected error during validation:\n\n{e}",
                 "codes": ["104"],
                 "broken_titles": []
             }))
 
+    def _post(self, msg):
+        """Hand a message to the Tk poll loop (safe from worker threads)."""
+        self.q.append(msg)
+        self._q_event.set()
+
     def _poll_validation_only(self):
-        try:
-            while True:
-                msg = self.q.get_nowait()
+        if self._q_event.is_set():
+            self._q_event.clear()  # before draining, so a message appended meanwhile re-sets it
+            while self.q:
+                msg = self.q.popleft()
                 if isinstance(msg, tuple) and msg and msg[0] in {"__VALIDATION_OK__","__VALIDATION_FAIL__"}:
                     token, payload = msg
                     self.prog.stop(); self.phase="idle"
@@ -1627,8 +2045,7 @@ class DashboardFrame(ttk.Frame):
                     return
                 else:
                     self._log(msg if isinstance(msg,str) else str(msg))
-        except queue.Empty:
-            self.after(50, self._poll_validation_only)
+        self.after(50, self._poll_validation_only)
 
     # ----- run -----
     def _run_only(self):
@@ -1687,24 +2104,24 @@ class DashboardFrame(ttk.Frame):
             proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1, universal_newlines=True)
             self.proc = proc
             for line in proc.stdout:
-                self.q.put(line)
+                self._post(line)
             rc = proc.wait()
             self._last_exit_code = rc
         except Exception as e:
             self._last_exit_code = -1
-            self.q.put(f"\nERROR: {e}\n")
+            self._post(f"\nERROR: {e}\n")
         finally:
-            self.q.put("__DONE__")
+            self._post("__DONE__")
 
     def _poll_queue(self):
-        try:
-            while True:
-                msg = self.q.get_nowait()
+        if self._q_event.is_set():
+            self._q_event.clear()
+            while self.q:
+                msg = self.q.popleft()
                 if msg == "__DONE__":
                     self._finish_run(); return
                 self._log(msg)
-        except queue.Empty:
-            self.after(50, self._poll_queue)
+        self.after(50, self._poll_queue)
 
     def _find_shopify_import_csv(self, outdir: str):
         """
@@ -1863,8 +2280,8 @@ class DashboardFrame(ttk.Frame):
                 messagebox.showerror(APP_TITLE, "New passwords do not match."); return
             users = cfg.get("users", [])
             for rec in users:
-                if rec.get("username")==u and rec.get("password")==p:
-                    rec["password"] = n
+                if rec.get("username")==u and verify_password(rec, p):
+                    set_password(rec, n)
                     save_config(cfg)
                     messagebox.showinfo(APP_TITLE, "Password updated."); dlg.destroy(); return
             messagebox.showerror(APP_TITLE, "Invalid username or current password.")
@@ -1882,10 +2299,31 @@ class DashboardFrame(ttk.Frame):
         try: os.startfile(d)
         except Exception: messagebox.showinfo(APP_TITLE, d)
 
-    def _clear_log(self): self.txt.delete("1.0","end")
+    def _clear_log(self):
+        self._log_buf.clear()
+        self._log_lines = 0
+        self.txt.delete("1.0","end")
     def _log(self, s:str):
+        # buffered: lines are written to the Text widget in one insert per flush
         if not s.endswith("\n"): s = s + "\n"
-        self.txt.insert("end", s); self.txt.see("end")
+        self._log_buf.append(s)
+        if not self._log_pending:
+            self._log_pending = True
+            self.after(80, self._flush_log)
+    def _flush_log(self):
+        self._log_pending = False
+        if not self._log_buf:
+            return
+        text = "".join(self._log_buf)
+        self._log_buf.clear()
+        self.txt.insert("end", text)
+        # ring-buffer the widget: drop the oldest lines (counted, no widget query)
+        self._log_lines += text.count("\n")
+        excess = self._log_lines - self.MAX_LOG_LINES
+        if excess > 0:
+            self.txt.delete("1.0", f"{excess + 1}.0")
+            self._log_lines = self.MAX_LOG_LINES
+        self.txt.see("end")
 
 
 # ===== Main App (container that swaps frames) =====
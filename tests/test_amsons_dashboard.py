@@ -0,0 +1,78 @@
+import queue
+import sys
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+
+import amsons_dashboard as ad
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8-sig")
+    return path
+
+
+def test_prev_export_csv_all_digit_skus_with_blank_row(tmp_path):
+    prev = _write(tmp_path / "prev.csv",
+                  "Title,Variant SKU\nShirt,110357\n,\nTrousers,110360\n")
+
+    df = ad._read_csv_str(prev, usecols=["Title", "Variant SKU"])
+    assert df["Variant SKU"].fillna("").tolist() == ["110357", "", "110360"]
+    assert df["Title"].fillna("").tolist() == ["Shirt", "", "Trousers"]
+
+    assert ad._highest_base_from_skus(ad._read_prev_sku_column(prev)["Variant SKU"]) == 110357
+    assert ad.load_prev_highest_base(prev) == 110357
+
+
+def test_postprocess_csv_round_trip_keeps_cell_text(tmp_path):
+    out = _write(tmp_path / "shopify_import.csv",
+                 "Handle,Title,Variant Price,Variant Barcode,Variant Grams,Status\n"
+                 "shirt,Shirt,10.00,0123,100,\n"
+                 "shirt,,19.90,,,\n")
+    frame = ad.DashboardFrame.__new__(ad.DashboardFrame)
+    frame._df_cache = {}
+
+    frame._postprocess_csv(str(tmp_path), "draft")
+
+    df = pd.read_csv(out, dtype=str, keep_default_na=False)
+    assert df["Variant Price"].tolist() == ["10.00", "19.90"]
+    assert df["Variant Barcode"].tolist() == ["0123", ""]
+    assert df["Variant Grams"].tolist() == ["100", ""]
+    assert df["Status"].tolist() == ["draft", "draft"]
+
+
+def test_worker_queues_only_whole_lines(tmp_path):
+    # one line written in two pipe reads, plus an unterminated last line
+    child = ("import sys, time; w = sys.stdout.write; f = sys.stdout.flush; "
+             "w('first half '); f(); time.sleep(0.3); w('second half\\nlast'); f()")
+    frame = ad.DashboardFrame.__new__(ad.DashboardFrame)
+    frame.q = queue.Queue()
+
+    frame._worker([sys.executable, "-c", child])
+
+    msgs = []
+    while (m := frame.q.get_nowait()) != "__DONE__":
+        msgs.append(m)
+    assert msgs == ["first half second half\n", "last"]
+    assert frame._last_exit_code == 0
+
+
+def test_read_products_sheet_matches_read_excel_na_handling(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    path = tmp_path / "products.xlsx"
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.title = "Products"
+    ws.append(["Title", "Variant Price", "Variant SKU", "Notes"])
+    ws.append(["Shirt", "#N/A", 110357, "N/A"])
+    ws.append(["NA", 19.9, "110358", "null"])
+    ws.append(["Trousers", 10.0, "NaN", "n/a"])
+    ws.append([None, "", None, "keep me"])
+    wb.save(path)
+
+    got = ad._read_products_sheet(path, "Products")
+    want = pd.read_excel(path, sheet_name="Products", dtype=str)
+    assert list(got.columns) == list(want.columns)
+    assert got.astype(object).where(got.notna(), None).values.tolist() == \
+        want.astype(object).where(want.notna(), None).values.tolist()